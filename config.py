@@ -12,6 +12,12 @@ class Config:
     KIS_WS_URL = os.getenv("KIS_WS_URL", "ws://ops.koreainvestment.com:21000")
     KIS_ACCOUNT_NO = os.getenv("KIS_ACCOUNT_NO")
     KIS_IS_VTS = os.getenv("KIS_IS_VTS", "true").lower() == "true"
+    # KIS REST 요청 속도 제한 (토큰 버킷: 초당 보충량/최대 버스트). 모의투자 2TPS, 실전 20TPS 한도 기준 기본값
+    # 버스트 + 1초 보충량이 한도를 넘지 않도록 설정 (모의투자는 버스트 1 → 약 0.56초 간격 순차 슬롯)
+    KIS_RATE_PER_SEC = float(os.getenv("KIS_RATE_PER_SEC", "1.8" if KIS_IS_VTS else "15"))
+    KIS_RATE_BURST = float(os.getenv("KIS_RATE_BURST", "1" if KIS_IS_VTS else "5"))
+    # USD 가용 현금 조회(매수가능금액 API) ITEM_CD. 비우면 보유 해외 종목 코드를 사용
+    KIS_USD_CASH_PROBE_TICKER = os.getenv("KIS_USD_CASH_PROBE_TICKER", "AAPL").strip().upper()
     # 실전투자 환경에서만 사후장(시간외) 주문 메서드 활성화
     KIS_ENABLE_AFTER_HOURS_ORDER = os.getenv("KIS_ENABLE_AFTER_HOURS_ORDER", "false").lower() == "true"
     # 사후장 주문 구분값(기본: 장후 시간외)
@@ -17,6 +17,10 @@ async def lifespan(app: FastAPI):
     # 앱 시작 시
     AlertService.send_slack_alert("🚀 [시스템 알림] Sean's Stock Advisor 서버가 시작되었습니다. 실시간 감시 및 매매 전략 가동을 시작합니다.")
     
+    # KIS 토큰을 세션 파일에서 미리 적재 (없으면 첫 요청 시 발급)
+    from services.kis.kis_service import KisService
+    KisService.preload_token()
+
     # 스케줄러 실행 (웹소켓 서비스 포함)
     SchedulerService.start()
 
@@ -44,7 +44,7 @@ def _build_tick_updates_from_payload(payload: TickTradingSettingsRequest) -> Dic
 async def place_order(order: OrderRequest) -> Dict[str, Any]:
     """주식 매수/매도 주문."""
     try:
-        result = KisService.send_order(order.ticker, order.quantity, order.price, order.order_type)
+        result = await KisService.send_order_async(order.ticker, order.quantity, order.price, order.order_type)
         if result.get("status") == "success":
             return result
         raise HTTPException(status_code=400, detail=result.get("msg", "Order failed"))
@@ -56,7 +56,7 @@ async def place_order(order: OrderRequest) -> Dict[str, Any]:
 async def get_balance() -> Dict[str, Any]:
     """주식 잔고 조회."""
     try:
-        balance = KisService.get_balance()
+        balance = await KisService.get_balance_async()
         if balance:
             return balance
         raise HTTPException(status_code=400, detail="Failed to fetch balance")
@@ -18,6 +18,8 @@ class StockRankingService:
             exchanges = ["NAS", "NYS", "AMS"]
             
         logger.info(f"🌐 Populating top overseas stocks for {exchanges}...")
+        # StockMeta 저장용 TR ID/Path — 환경(VTS/실전)에 맞게 DB에서 1회 조회
+        tr_id, api_path = StockMetaService.get_api_info("해외주식_상세시세")
         
         for excd in exchanges:
             try:
@@ -33,8 +35,6 @@ class StockRankingService:
                     
                     if not ticker: continue
                     
-                    # StockMeta 저장 — TR ID/Path는 환경(VTS/실전)에 맞게 DB에서 조회
-                    tr_id, api_path = StockMetaService.get_api_info("해외주식_상세시세")
                     StockMetaService.upsert_stock_meta(
                         ticker=ticker,
                         name_en=name_en,
@@ -394,18 +394,17 @@ class SchedulerService:
             us_tickers_in_low = [t for t in active_tickers if not is_kr(t)]
             if us_tickers_in_low:
                 us_meta_map = {
-                    m.ticker: m for m in StockMetaService.get_stock_meta_bulk(us_tickers_in_low)
+                    m.ticker: {"api_market_code": getattr(m, "api_market_code", "NAS")}
+                    for m in StockMetaService.get_stock_meta_bulk(us_tickers_in_low)
                 }
 
+            infos = KisFetcher.fetch_many_domestic_prices(token, [t for t in active_tickers if is_kr(t)])
+            infos.update(KisFetcher.fetch_many_overseas_prices(token, us_tickers_in_low, meta_map=us_meta_map))
+
             success, fail = 0, 0
             for ticker in active_tickers:
                 try:
-                    if is_kr(ticker):
-                        info = KisFetcher.fetch_domestic_price(token, ticker)
-                    else:
-                        meta_row = us_meta_map.get(ticker)
-                        meta = {"api_market_code": getattr(meta_row, "api_market_code", "NAS")} if meta_row else {}
-                        info = KisFetcher.fetch_overseas_price(token, ticker, meta=meta)
+                    info = infos.get(ticker) or {}
                     price = float(info.get("price") or 0)
                     change_rate = float(info.get("rate") or info.get("change_rate") or 0)
                     if price > 0:
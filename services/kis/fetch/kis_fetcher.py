@@ -1,37 +1,126 @@
-import requests
-import json
+import asyncio
 import logging
 import time
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from config import Config
+from services.kis.kis_http import KisHttp, REQUEST_TIMEOUT_DEFAULT
+from utils import fast_json
 from utils.logger import get_logger
+from utils.market import is_kr
 
 logger = get_logger("kis_fetcher")
 
-# KIS API 상수
-KIS_RATE_LIMIT_MSG_CD = "EGW00201"
-REQUEST_TIMEOUT_DEFAULT = 5
+# 현재가 캐시 (스크리너/포트폴리오 재계산 시 동일 종목 반복 조회 방지)
+PRICE_CACHE_TTL_SEC = 15.0
+PRICE_CACHE_MAX_ENTRIES = 2048
+# 시가총액 순위는 조회 주기(분 단위) 동안 사실상 변하지 않으므로 더 길게 캐시
+RANKING_CACHE_TTL_SEC = 60.0
+# 현재가 일괄 조회용 공유 스레드 풀 (실제 송신 속도는 _throttle_request 토큰 버킷이 제한)
+BATCH_FETCH_WORKERS = 4
+_batch_fetch_pool = ThreadPoolExecutor(max_workers=BATCH_FETCH_WORKERS, thread_name_prefix="kis-fetch")
+# 해외 거래소 코드 → KIS 시세/랭킹 API용 3자리 EXCD (4자리/3자리 모두 허용)
+EXCD_MAP = {
+    "NASD": "NAS", "NAS": "NAS",
+    "NYSE": "NYS", "NYS": "NYS",
+    "AMEX": "AMS", "AMS": "AMS",
+    "IDX": "IDX",
+}
+# 차트 API(FHKST03030100)용 시장 구분 코드
+CHART_MRKT_MAP = {"NASD": "N", "NAS": "N", "NYSE": "Y", "NYS": "Y", "AMEX": "A", "AMS": "A", "IDX": "U"}
+
+
+# (결과 키, KIS 응답 필드) — 응답 dict를 한 번의 순회로 float 변환하기 위한 매핑
+DOMESTIC_PRICE_FIELDS = (
+    ("price", "stck_prpr"),
+    ("prev_close", "stck_sdpr"),
+    ("change", "prdy_vrss"),
+    ("change_rate", "prdy_ctrt"),
+    ("per", "per"),
+    ("pbr", "pbr"),
+    ("eps", "eps"),
+    ("bps", "bps"),
+    ("high52", "h52_curr_prc"),
+    ("low52", "l52_curr_prc"),
+    ("volume", "acml_vol"),
+    ("amount", "acml_tr_pbmn"),
+)
+OVERSEAS_DETAIL_FIELDS = (
+    ("price", "last"),
+    ("prev_close", "base"),
+    ("per", "perx"),
+    ("pbr", "pbrx"),
+    ("eps", "epsx"),
+    ("bps", "bpsx"),
+    ("market_cap", "tomv"),
+    ("high52", "h52p"),
+    ("low52", "l52p"),
+    ("volume", "tvol"),
+    ("amount", "tamt"),
+)
+OVERSEAS_PRICE_FIELDS = (
+    ("prev_close", "base"),
+    ("change", "diff"),
+    ("change_rate", "rate"),
+)
+# 국내 일자별 시세(output2) 중 히스토리 계산에 필요한 필드만 추출
+DAILY_PRICE_FIELDS = (
+    ("open", "stck_oprc"),
+    ("high", "stck_hgpr"),
+    ("low", "stck_lwpr"),
+    ("close", "stck_clpr"),
+    ("volume", "acml_vol"),
+)
 
 
 def _safe_float(val, default: float = 0.0) -> float:
     """문자열/None을 float으로 변환. 실패 시 default 반환."""
+    # JSON 숫자로 파싱된 값은 변환 없이 바로 반환 (isinstance보다 type 비교가 빠름, bool 제외)
+    val_type = type(val)
+    if val_type is float:
+        return val
+    if val_type is int:
+        return float(val)
     try:
-        if val is None or str(val).strip() == "":
-            return default
+        # float()은 공백을 허용하고 ""/None은 예외를 내므로 별도 strip 검사가 필요 없음
         return float(val)
-    except Exception:
+    except (TypeError, ValueError):
         return default
 
 
+def _normalize_excd(market: str) -> str:
+    """거래소 코드를 KIS EXCD(3자리)로 변환. 매핑에 없으면 앞 3자리 사용"""
+    upper = market.upper()
+    return EXCD_MAP.get(upper) or upper[:3]
+
+
+def _map_numeric_fields(output: dict, fields: tuple) -> dict:
+    """fields 매핑에 정의된 응답 필드를 한 번에 float으로 변환"""
+    get = output.get
+    return {key: _safe_float(get(src)) for key, src in fields}
+
+
+class _InflightCall:
+    """동일 키로 진행 중인 조회 (완료 시 event set, 결과 공유)"""
+    __slots__ = ("event", "result")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = {}
+
+
 class KisFetcher:
     """
     한국투자증권(KIS) REST API를 통해 원시 데이터를 수집하는 헬퍼 클래스
     - 데이터베이스(api_tr_meta)에 저장된 TR ID와 경로 정보를 동적으로 사용합니다.
     - 모의투자(VTS) 및 실전투자 환경을 Config.KIS_IS_VTS 플래그로 구분하여 대응합니다.
     """
-    _req_lock = threading.Lock()
-    _last_req_ts = 0.0
-    _min_req_interval = 0.55  # VTS 기준 약 2TPS 제한 대응
+    # {key: (expires_at, result)} — 오래된 항목부터 제거
+    _price_cache: OrderedDict = OrderedDict()
+    _price_inflight: dict = {}
+    _price_cache_lock = threading.Lock()
     
     @staticmethod
     def _get_api_info(api_name: str) -> tuple:
@@ -39,100 +128,89 @@ class KisFetcher:
         from services.market.stock_meta_service import StockMetaService
         return StockMetaService.get_api_info(api_name, is_vts=Config.KIS_IS_VTS)
 
+    @classmethod
+    def _get_endpoint(cls, api_name: str, default_path: str = None) -> tuple:
+        """(tr_id, path, url) 조회. TR ID/경로는 StockMetaService.get_api_info 캐시를 사용합니다."""
+        tr_id, path = cls._get_api_info(api_name)
+        path = path or default_path
+        if not path:
+            return tr_id, None, None
+        return tr_id, path, f"{Config.KIS_BASE_URL}{path}"
+
     @staticmethod
     def _get_headers(token: str, tr_id: str) -> dict:
         """KIS API 공통 헤더 생성"""
-        return {
-            "content-type": "application/json; charset=utf-8",
-            "authorization": f"Bearer {token}",
-            "appkey": Config.KIS_APP_KEY,
-            "appsecret": Config.KIS_APP_SECRET,
-            "tr_id": tr_id,
-            "custtype": "P"
-        }
+        return KisHttp.build_headers(token, tr_id)
 
     @classmethod
-    def _throttle_request(cls):
-        with cls._req_lock:
-            now = time.time()
-            elapsed = now - cls._last_req_ts
-            if elapsed < cls._min_req_interval:
-                time.sleep(cls._min_req_interval - elapsed)
-            cls._last_req_ts = time.time()
+    def _get_cached_price(cls, key: tuple, loader, ttl: float = PRICE_CACHE_TTL_SEC) -> dict:
+        """시세 TTL 캐시 조회 (현재가 기본 15초, 순위 등은 ttl 지정).
+        캐시가 없으면 loader()를 호출하며, 같은 키의 동시 요청은 하나의 API 호출로 병합합니다.
+        """
+        with cls._price_cache_lock:
+            entry = cls._price_cache.get(key)
+            if entry and time.monotonic() < entry[0]:
+                return entry[1]
+            call = cls._price_inflight.get(key)
+            is_owner = call is None
+            if is_owner:
+                call = cls._price_inflight[key] = _InflightCall()
+
+        if not is_owner:
+            call.event.wait(REQUEST_TIMEOUT_DEFAULT * 4)
+            return call.result
 
-    @classmethod
-    def _is_rate_limited_response(cls, response: requests.Response) -> bool:
-        if response.status_code in (429, 500):
-            return True
-        text = response.text or ""
-        if "초당 거래건수" in text:
-            return True
         try:
-            body = response.json()
-            if body.get("msg_cd") == KIS_RATE_LIMIT_MSG_CD:
-                return True
-        except Exception:
-            pass
-        return False
+            call.result = loader() or {}
+            if call.result:
+                with cls._price_cache_lock:
+                    cls._price_cache[key] = (time.monotonic() + ttl, call.result)
+                    cls._price_cache.move_to_end(key)
+                    while len(cls._price_cache) > PRICE_CACHE_MAX_ENTRIES:
+                        cls._price_cache.popitem(last=False)
+            return call.result
+        finally:
+            with cls._price_cache_lock:
+                cls._price_inflight.pop(key, None)
+            call.event.set()
 
     @classmethod
-    def _get_with_retry(cls, url: str, headers: dict, params: dict, timeout: int = None, retries: int = 4):
-        if timeout is None:
-            timeout = REQUEST_TIMEOUT_DEFAULT
-        last_response = None
-        for attempt in range(retries):
-            cls._throttle_request()
-            try:
-                response = requests.get(url, headers=headers, params=params, timeout=timeout)
-                last_response = response
-                if cls._is_rate_limited_response(response):
-                    wait_sec = 1.2 * (attempt + 1)
-                    logger.warning(f"⏳ TPS limit hit. retry {attempt + 1}/{retries} in {wait_sec:.1f}s...")
-                    time.sleep(wait_sec)
-                    continue
-                return response
-            except Exception:
-                time.sleep(0.7 * (attempt + 1))
-        return last_response
+    def clear_cache(cls) -> None:
+        """시세/순위 캐시 전체 비우기 (강제 새로고침용)"""
+        with cls._price_cache_lock:
+            cls._price_cache.clear()
 
     @classmethod
     def fetch_domestic_price(cls, token: str, ticker: str, meta: dict = None) -> dict:
-        """국내 주식 현재가 조회"""
-        tr_id, path = cls._get_api_info("주식현재가_시세")
+        """국내 주식 현재가 조회 (15초 TTL 캐시)"""
+        return cls._get_cached_price(("KR", ticker), lambda: cls._request_domestic_price(token, ticker))
+
+    @classmethod
+    def _request_domestic_price(cls, token: str, ticker: str) -> dict:
+        """국내 주식 현재가 API 호출"""
+        tr_id, path, url = cls._get_endpoint("주식현재가_시세")
         if not path: return {}
         
-        url = f"{Config.KIS_BASE_URL}{path}"
         params = {"fid_cond_mrkt_div_code": "J", "fid_input_iscd": ticker}
         
         try:
             headers = cls._get_headers(token, tr_id=tr_id)
-            response = cls._get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=4)
+            response = KisHttp.get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=4)
             if response is None:
                 return {}
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = fast_json.loads(response.content)
                 output = response_data.get("output", {})
                 if not output:
                     logger.warning(f"⚠️ Domestic price output empty for {ticker}: {response_data.get('msg1')}")
                     return {}
-                return {
-                    "price": _safe_float(output.get('stck_prpr')),
-                    "prev_close": _safe_float(output.get('stck_sdpr')),
-                    "change": _safe_float(output.get('prdy_vrss')),
-                    "change_rate": _safe_float(output.get('prdy_ctrt')),
-                    "per": _safe_float(output.get('per')),
-                    "pbr": _safe_float(output.get('pbr')),
-                    "eps": _safe_float(output.get('eps')),
-                    "bps": _safe_float(output.get('bps')),
-                    "market_cap": _safe_float(output.get('lstn_stcn')) * _safe_float(output.get('stck_prpr')) if output.get('lstn_stcn') else 0,
-                    "high52": _safe_float(output.get('h52_curr_prc')),
-                    "low52": _safe_float(output.get('l52_curr_prc')),
-                    "volume": _safe_float(output.get('acml_vol')),
-                    "amount": _safe_float(output.get('acml_tr_pbmn')),
-                    "name": output.get('hts_kor_isnm', ticker),
-                    "raw": output
-                }
-            elif response.status_code == 500 or "초당" in response.text:
+                result = _map_numeric_fields(output, DOMESTIC_PRICE_FIELDS)
+                listed_shares = output.get('lstn_stcn')
+                result["market_cap"] = _safe_float(listed_shares) * result["price"] if listed_shares else 0
+                result["name"] = output.get('hts_kor_isnm', ticker)
+                result["raw"] = output
+                return result
+            elif KisHttp.is_rate_limited(response):
                 logger.warning(f"⏳ TPS Limit reached for {ticker}. Waiting 1.5s...")
                 time.sleep(1.5)
                 return {}
@@ -143,52 +221,95 @@ class KisFetcher:
             logger.error(f"Error fetching domestic price for {ticker}: {e}")
             return {}
 
+    @classmethod
+    def _fetch_many(cls, jobs: dict) -> dict:
+        """{ticker: 호출 함수}를 공유 스레드 풀에서 병렬 실행해 {ticker: 결과 dict}로 반환"""
+        futures = {ticker: _batch_fetch_pool.submit(job) for ticker, job in jobs.items()}
+        results = {}
+        for ticker, future in futures.items():
+            try:
+                results[ticker] = future.result() or {}
+            except Exception as e:
+                logger.error(f"Error fetching price for {ticker}: {e}")
+                results[ticker] = {}
+        return results
+
+    @classmethod
+    def fetch_many_domestic_prices(cls, token: str, tickers: list) -> dict:
+        """국내 주식 현재가 일괄 조회. {ticker: fetch_domestic_price 결과}"""
+        return cls._fetch_many({
+            ticker: (lambda t=ticker: cls.fetch_domestic_price(token, t))
+            for ticker in tickers
+        })
+
+    @classmethod
+    def fetch_many_overseas_prices(cls, token: str, tickers: list, meta_map: dict = None) -> dict:
+        """해외 주식 현재가 일괄 조회. meta_map은 {ticker: meta dict}, 결과는 {ticker: fetch_overseas_price 결과}"""
+        meta_map = meta_map or {}
+        return cls._fetch_many({
+            ticker: (lambda t=ticker: cls.fetch_overseas_price(token, t, meta=meta_map.get(t)))
+            for ticker in tickers
+        })
+
+    @classmethod
+    async def async_fetch_domestic_price(cls, token: str, ticker: str, meta: dict = None) -> dict:
+        """fetch_domestic_price 비동기 버전 (공유 풀에서 실행해 이벤트 루프를 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_batch_fetch_pool, cls.fetch_domestic_price, token, ticker, meta)
+
+    @classmethod
+    async def async_fetch_overseas_price(cls, token: str, ticker: str, meta: dict = None) -> dict:
+        """fetch_overseas_price 비동기 버전 (공유 풀에서 실행해 이벤트 루프를 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_batch_fetch_pool, cls.fetch_overseas_price, token, ticker, meta)
+
+    @classmethod
+    async def fetch_many_async(cls, token: str, tickers: list, meta_map: dict = None) -> dict:
+        """국내/해외 혼합 종목 현재가 비동기 일괄 조회. {ticker: 결과}, 실패한 종목은 {}"""
+        meta_map = meta_map or {}
+        results = await asyncio.gather(
+            *(
+                cls.async_fetch_domestic_price(token, ticker) if is_kr(ticker)
+                else cls.async_fetch_overseas_price(token, ticker, meta_map.get(ticker))
+                for ticker in tickers
+            ),
+            return_exceptions=True,
+        )
+        prices = {}
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching price for {ticker}: {result}")
+                result = {}
+            prices[ticker] = result or {}
+        return prices
+
     @classmethod
     def fetch_overseas_detail(cls, token: str, ticker: str, meta: dict = None) -> dict:
         """해외 주식 상세 시세 조회 (PER, PBR, EPS 등 포함)"""
-        from models.kis_schemas import OverseasDetailPriceResponse
-        
-        tr_id, path = cls._get_api_info("해외주식_상세시세")
-        if not path:
-             path = "/uapi/overseas-price/v1/quotations/price-detail"
+        tr_id, path, url = cls._get_endpoint("해외주식_상세시세", default_path="/uapi/overseas-price/v1/quotations/price-detail")
         
         market = (meta and meta.get('api_market_code')) or "NAS"
-        market_map_4to3 = {"NASD": "NAS", "NYSE": "NYS", "AMEX": "AMS"}
-        kis_market = market_map_4to3.get(market.upper(), market.upper())
-        if len(kis_market) > 3 and kis_market != "IDX":
-             kis_market = kis_market[:3]
+        kis_market = _normalize_excd(market)
 
-        url = f"{Config.KIS_BASE_URL}{path}"
         params = {"AUTH": "", "EXCD": kis_market, "SYMB": ticker}
         
         try:
             headers = cls._get_headers(token, tr_id=tr_id)
-            response = cls._get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=4)
+            response = KisHttp.get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=4)
             if response is None:
                 return {}
             if response.status_code == 200:
-                response_data = response.json()
+                response_data = fast_json.loads(response.content)
                 output_raw = response_data.get("output", {})
                 if output_raw:
-                    # 스키마를 통한 검증 및 파싱
-                    output = OverseasDetailPriceResponse(**output_raw)
-                    return {
-                        "price": _safe_float(output.last),
-                        "prev_close": _safe_float(output.base),
-                        "change": _safe_float(output.t_xdif or output.p_xdif),
-                        "change_rate": _safe_float(output.t_xrat or output.p_xrat),
-                        "per": _safe_float(output.perx),
-                        "pbr": _safe_float(output.pbrx),
-                        "eps": _safe_float(output.epsx),
-                        "bps": _safe_float(output.bpsx),
-                        "market_cap": _safe_float(output.tomv),
-                        "high52": _safe_float(output.h52p),
-                        "low52": _safe_float(output.l52p),
-                        "volume": _safe_float(output.tvol),
-                        "amount": _safe_float(output.tamt),
-                        "name": output.hnam or ticker,
-                        "raw": output.model_dump()
-                    }
+                    # 필드 정의는 models.kis_schemas.OverseasDetailPriceResponse 참고 (hot path에서는 dict 직접 사용)
+                    get = output_raw.get
+                    result = _map_numeric_fields(output_raw, OVERSEAS_DETAIL_FIELDS)
+                    result["change"] = _safe_float(get("t_xdif") or get("p_xdif"))
+                    result["change_rate"] = _safe_float(get("t_xrat") or get("p_xrat"))
+                    result["name"] = get("hnam") or ticker
+                    result["raw"] = output_raw
+                    return result
             return {}
         except Exception as e:
             logger.error(f"❌ Overseas Detail Price Exception for {ticker}: {e}")
@@ -196,35 +317,33 @@ class KisFetcher:
 
     @classmethod
     def fetch_overseas_price(cls, token: str, ticker: str, meta: dict = None) -> dict:
-        """해외 주식 기본 현재가 조회 (HHDFS00000300)"""
-        tr_id, path = cls._get_api_info("해외주식_현재가")
-        if not path: return {}
-            
+        """해외 주식 기본 현재가 조회 (HHDFS00000300, 15초 TTL 캐시)"""
         market = (meta and meta.get('api_market_code')) or "NAS"
-        market_map_4to3 = {"NASD": "NAS", "NYSE": "NYS", "AMEX": "AMS"}
-        kis_market = market_map_4to3.get(market.upper(), market.upper())
-        if len(kis_market) > 3 and kis_market != "IDX":
-             kis_market = kis_market[:3]
+        kis_market = _normalize_excd(market)
+        return cls._get_cached_price(
+            (kis_market, ticker), lambda: cls._request_overseas_price(token, ticker, kis_market)
+        )
+
+    @classmethod
+    def _request_overseas_price(cls, token: str, ticker: str, kis_market: str) -> dict:
+        """해외 주식 기본 현재가 API 호출"""
+        tr_id, path, url = cls._get_endpoint("해외주식_현재가")
+        if not path: return {}
 
-        url = f"{Config.KIS_BASE_URL}{path}"
         params = {"AUTH": "", "EXCD": kis_market, "SYMB": ticker}
         
         try:
             headers = cls._get_headers(token, tr_id=tr_id)
-            response = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT)
-            if response.status_code == 200:
-                response_data = response.json()
+            response = KisHttp.get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=2)
+            if response is not None and response.status_code == 200:
+                response_data = fast_json.loads(response.content)
                 output = response_data.get("output", {})
                 if output:
-                    price = _safe_float(output.get("last")) or _safe_float(output.get("clos"))
-                    return {
-                        "price": price,
-                        "prev_close": _safe_float(output.get('base')),
-                        "change": _safe_float(output.get('diff')),
-                        "change_rate": _safe_float(output.get('rate')),
-                        "name": output.get('hnam', ticker),
-                        "raw": output
-                    }
+                    result = {"price": _safe_float(output.get("last")) or _safe_float(output.get("clos"))}
+                    result.update(_map_numeric_fields(output, OVERSEAS_PRICE_FIELDS))
+                    result["name"] = output.get('hnam', ticker)
+                    result["raw"] = output
+                    return result
             return {}
         except Exception as e:
             logger.error(f"❌ Overseas Price Exception for {ticker}: {e}")
@@ -232,36 +351,35 @@ class KisFetcher:
 
     @classmethod
     def fetch_overseas_ranking(cls, token: str, excd: str = "NAS") -> dict:
-        """해외 주식 시가총액 순위 조회 (VTS 대응)"""
-        tr_id, path = cls._get_api_info("해외주식_시가총액순위")
-        if not path: return {}
-        
+        """해외 주식 시가총액 순위 조회 (60초 TTL 캐시)"""
         # EXCD 보정 (3자리만 사용)
-        market_map = {"NASD": "NAS", "NAS": "NAS", "NYSE": "NYS", "NYS": "NYS", "AMEX": "AMS", "AMS": "AMS"}
-        kis_excd = market_map.get(excd.upper(), excd.upper()[:3])
+        kis_excd = _normalize_excd(excd)
+        return cls._get_cached_price(
+            ("RANK", kis_excd), lambda: cls._request_overseas_ranking(token, kis_excd), ttl=RANKING_CACHE_TTL_SEC
+        )
+
+    @classmethod
+    def _request_overseas_ranking(cls, token: str, kis_excd: str) -> dict:
+        """해외 주식 시가총액 순위 API 호출 (VTS 대응)"""
+        tr_id, path, url = cls._get_endpoint("해외주식_시가총액순위")
+        if not path: return {}
 
-        url = f"{Config.KIS_BASE_URL}{path}"
         params = {"AUTH": "", "EXCD": kis_excd, "GUBN": "0"}
         
-        for attempt in range(2):
-            try:
-                headers = cls._get_headers(token, tr_id=tr_id)
-                response = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT)
-                if response.status_code == 200:
-                    response_data = response.json()
-                    if response_data.get("output2"):
-                        response_data["output"] = response_data["output2"]
-                        return response_data
-                elif response.status_code == 500 or "초당" in response.text:
-                    logger.warning(f"⏳ Rate limit hit (Overseas Ranking {kis_excd}). Retrying in 1.5s...")
-                    time.sleep(1.5)
-                    continue
-                else:
-                    logger.error(f"❌ Overseas Ranking Error {response.status_code}: {response.text}")
-                    break
-            except Exception as e:
-                logger.error(f"❌ Overseas Ranking Exception: {e}")
-                time.sleep(1.5)
+        try:
+            headers = cls._get_headers(token, tr_id=tr_id)
+            response = KisHttp.get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=2)
+            if response is None:
+                return {}
+            if response.status_code != 200:
+                logger.error(f"❌ Overseas Ranking Error {response.status_code}: {response.text}")
+                return {}
+            response_data = fast_json.loads(response.content)
+            if response_data.get("output2"):
+                response_data["output"] = response_data["output2"]
+                return response_data
+        except Exception as e:
+            logger.error(f"❌ Overseas Ranking Exception: {e}")
         return {}
 
     @classmethod
@@ -275,50 +393,43 @@ class KisFetcher:
                 logger.info(f"💡 VTS mode: Using MasterDataService for domestic ranking.")
                 return {"output": top_stocks}
 
-        tr_id, path = cls._get_api_info("국내주식_시가총액순위")
+        tr_id, path, url = cls._get_endpoint("국내주식_시가총액순위")
         if not path: return {}
         
-        url = f"{Config.KIS_BASE_URL}{path}"
-        for div_code in ["J"]: # '0'은 유효하지 않으므로 'J'만 시도
-            params = {
-                "fid_cond_mrkt_div_code": div_code,
-                "fid_cond_scr_div_code": "20170",
-                "fid_div_cls_code": "0",
-                "fid_rank_sort_cls_code": "0",
-                "fid_input_cnt_1": "0",
-                "fid_prc_cls_code": "0",
-                "fid_input_iscd_1": mrkt_div
-            }
-            try:
-                headers = cls._get_headers(token, tr_id=tr_id)
-                response = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT)
-                if response.status_code == 200:
-                    response_data = response.json()
-                    output = response_data.get("output") or response_data.get("output2")
-                    if output:
-                        logger.info(f"✅ Success fetching domestic ranking with div_code={div_code} (Count: {len(output)})")
-                        response_data["output"] = output
-                        return response_data
-                    logger.warning(f"⚠️ Domestic ranking output empty for {div_code}: {response_data.get('msg1')}")
-                elif response.status_code == 500 or "초당" in response.text:
-                    logger.warning("⏳ Rate limit or 500 error for ranking. Waiting 1.5s...")
-                    time.sleep(1.5)
-                    continue
-                else:
-                    logger.error(f"❌ Domestic Ranking Error {response.status_code}: {response.text}")
-                time.sleep(1.2)
-            except Exception as e:
-                logger.error(f"❌ Domestic Ranking Exception: {e}")
-                time.sleep(1.2)
+        div_code = "J"  # '0'은 유효하지 않으므로 'J'만 사용
+        params = {
+            "fid_cond_mrkt_div_code": div_code,
+            "fid_cond_scr_div_code": "20170",
+            "fid_div_cls_code": "0",
+            "fid_rank_sort_cls_code": "0",
+            "fid_input_cnt_1": "0",
+            "fid_prc_cls_code": "0",
+            "fid_input_iscd_1": mrkt_div
+        }
+        try:
+            headers = cls._get_headers(token, tr_id=tr_id)
+            response = KisHttp.get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=2)
+            if response is None:
+                return {}
+            if response.status_code != 200:
+                logger.error(f"❌ Domestic Ranking Error {response.status_code}: {response.text}")
+                return {}
+            response_data = fast_json.loads(response.content)
+            output = response_data.get("output") or response_data.get("output2")
+            if output:
+                logger.info(f"✅ Success fetching domestic ranking with div_code={div_code} (Count: {len(output)})")
+                response_data["output"] = output
+                return response_data
+            logger.warning(f"⚠️ Domestic ranking output empty for {div_code}: {response_data.get('msg1')}")
+        except Exception as e:
+            logger.error(f"❌ Domestic Ranking Exception: {e}")
         return {}
 
     @classmethod
     def fetch_daily_price(cls, token: str, ticker: str, start_date: str, end_date: str) -> dict:
         """국내 주식 일자별 시세 조회"""
-        tr_id, path = cls._get_api_info("국내주식_일자별시세")
-        if not path: path = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
+        tr_id, path, url = cls._get_endpoint("국내주식_일자별시세", default_path="/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice")
         
-        url = f"{Config.KIS_BASE_URL}{path}"
         params = {
             "fid_cond_mrkt_div_code": "J",
             "fid_input_iscd": ticker,
@@ -329,21 +440,41 @@ class KisFetcher:
         }
         try:
             headers = cls._get_headers(token, tr_id=tr_id)
-            response = cls._get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=4)
+            response = KisHttp.get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=4)
             if response is None:
                 return {}
-            return response.json() if response.status_code == 200 else {}
+            return fast_json.loads(response.content) if response.status_code == 200 else {}
         except Exception as e:
             logger.error(f"Error fetching daily price for {ticker}: {e}")
             return {}
 
+    @classmethod
+    def fetch_daily_price_arrays(cls, token: str, ticker: str, start_date: str, end_date: str) -> dict:
+        """국내 주식 일자별 시세를 컬럼별 NumPy 배열로 반환.
+        {"date": datetime64[D], "open"/"high"/"low"/"close"/"volume": float64} 형태이며, 데이터가 없으면 빈 dict.
+        """
+        response = cls.fetch_daily_price(token, ticker, start_date, end_date)
+        # 휴장일 등으로 비어 있는 행({})은 제외
+        rows = [row for row in (response.get("output2") or []) if row.get("stck_bsop_date")]
+        if not rows:
+            return {}
+        count = len(rows)
+        # YYYYMMDD → ISO 문자열로 바꿔 datetime64 배열로 한 번에 변환
+        columns = {
+            "date": np.array(
+                [f"{d[:4]}-{d[4:6]}-{d[6:8]}" for d in (row["stck_bsop_date"] for row in rows)],
+                dtype="datetime64[D]",
+            )
+        }
+        for key, src in DAILY_PRICE_FIELDS:
+            columns[key] = np.fromiter((_safe_float(row.get(src), np.nan) for row in rows), dtype=np.float64, count=count)
+        return columns
+
     @classmethod
     def fetch_overseas_daily_price(cls, token: str, ticker: str, start_date: str, end_date: str) -> dict:
         """해외 주식 일자별 시세 조회"""
         from services.market.stock_meta_service import StockMetaService
-        tr_id, path = StockMetaService.get_api_info("해외주식_기간별시세")
-        
-        url = f"{Config.KIS_BASE_URL}{path}"
+        tr_id, path, url = cls._get_endpoint("해외주식_기간별시세")
         
         excd = "NAS"
         if ticker in ["SPX", "NAS", "VIX", "DJI", "TSX"]:
@@ -353,12 +484,12 @@ class KisFetcher:
                 meta = StockMetaService.get_stock_meta(ticker)
                 if meta and meta.api_market_code:
                     excd = meta.api_market_code
-            except: pass
+            except Exception:
+                pass
 
         if tr_id == "FHKST03030100":
             # 차트 API (지수용 등)
-            mrkt_map = {"NASD": "N", "NAS": "N", "NYSE": "Y", "NYS": "Y", "AMEX": "A", "AMS": "A", "IDX": "U"}
-            mrkt_code = mrkt_map.get(excd.upper(), "N")
+            mrkt_code = CHART_MRKT_MAP.get(excd.upper(), "N")
             
             params = {
                 "fid_cond_mrkt_div_code": mrkt_code,
@@ -370,9 +501,7 @@ class KisFetcher:
         else:
             # 기존 해외주식_기간별시세 (HHDFS76240000)
             # VTS여도 HHDFS TR이면 3자리를 기대함
-            market_map_4to3 = {"NASD": "NAS", "NYSE": "NYS", "AMEX": "AMS"}
-            kis_excd = market_map_4to3.get(excd.upper(), excd.upper())
-            if len(kis_excd) > 3 and kis_excd != "IDX": kis_excd = kis_excd[:3]
+            kis_excd = _normalize_excd(excd)
                 
             params = {
                 "AUTH": "",
@@ -385,13 +514,13 @@ class KisFetcher:
 
         try:
             headers = cls._get_headers(token, tr_id=tr_id)
-            response = cls._get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=5)
+            response = KisHttp.get_with_retry(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_DEFAULT, retries=5)
             if response is None:
                 return {}
             if response.status_code != 200:
                 logger.error(f"❌ Overseas Price Error {response.status_code} [Daily]: {url} | TR: {tr_id} | Params: {params} | Body: {response.text}")
                 return {}
-            response_data = response.json()
+            response_data = fast_json.loads(response.content)
             if response_data.get("output2") and not response_data.get("output"):
                 response_data["output"] = response_data["output2"]
             return response_data
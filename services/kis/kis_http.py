@@ -0,0 +1,269 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import Config
+from utils import fast_json
+from utils.logger import get_logger
+
+logger = get_logger("kis_http")
+
+# KIS API 상수
+KIS_RATE_LIMIT_MSG_CD = "EGW00201"
+REQUEST_TIMEOUT_DEFAULT = 5
+# requests timeout 인자: 초 단위 숫자 또는 (connect, read) 튜플
+Timeout = Union[float, tuple]
+# 제한 응답 판별용 bytes 패턴 (본문 디코딩/JSON 파싱 없이 앞부분만 검사)
+_RATE_LIMIT_MSG_BYTES = "초당 거래건수".encode("utf-8")
+_RATE_LIMIT_CODE_BYTES = KIS_RATE_LIMIT_MSG_CD.encode("ascii")
+# KIS 오류 응답은 rt_cd/msg_cd/msg1이 본문 앞쪽에 위치
+_RATE_LIMIT_SCAN_BYTES = 512
+# 재시도 대기: 지수 백오프(base * 2^attempt, 상한 cap) + 최대 50% 지터로 동시 재시도 분산
+RETRY_BASE_SEC = 1.0
+RETRY_MAX_SEC = 30.0
+RETRY_JITTER = 0.5
+# keep-alive 연결 풀 크기 (kis-fetch 4 + kis-order 5 + kis-interactive 3 + 스케줄러/요청 스레드 여유분)
+HTTP_POOL_SIZE = 13
+# 서킷 브레이커: 연속 실패 횟수 임계값과 차단 유지 시간
+CB_FAILURE_THRESHOLD = 5
+CB_OPEN_SEC = 30.0
+
+
+def _build_session() -> requests.Session:
+    """KIS 호스트용 keep-alive 세션 (TLS 핸드셰이크를 요청마다 반복하지 않도록 연결 재사용)"""
+    session = requests.Session()
+    # 연결 수립 실패만 전송 계층에서 재시도 (요청이 서버에 도달하지 않았으므로 주문 POST에도 안전).
+    # 상태 코드/읽기 오류 재시도는 KisHttp가 멱등성 여부에 따라 직접 판단
+    retry = Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.3, raise_on_status=False)
+    # pool_block=True: 풀이 가득 차면 일회용 연결을 새로 열지 않고 반납을 기다려 TLS 재협상을 피함
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry, pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _retry_after_sec(response: Optional[requests.Response]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환. 없거나 해석 불가면 None"""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def retry_delay(attempt: int, response: Optional[requests.Response] = None,
+                base: float = RETRY_BASE_SEC, cap: float = RETRY_MAX_SEC) -> float:
+    """재시도 전 대기 시간. 서버 Retry-After를 우선하고, 없으면 지터를 더한 지수 백오프"""
+    retry_after = _retry_after_sec(response)
+    if retry_after is not None:
+        return min(retry_after, cap)
+    return min(cap, base * (2 ** attempt)) * (1 + random.random() * RETRY_JITTER)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 일정 시간 호출을 차단하는 서킷 브레이커 (closed → open → half-open)
+    - threshold회 연속 실패하면 open_sec 동안 allow()가 False
+    - 차단 시간이 지나면 한 번의 시험 호출만 허용하고, 성공하면 닫힘 / 실패하면 다시 차단
+    """
+
+    def __init__(self, name: str, threshold: int = CB_FAILURE_THRESHOLD, open_sec: float = CB_OPEN_SEC):
+        self.name = name
+        self.threshold = threshold
+        self.open_sec = open_sec
+        self._failures = 0
+        self._open_until = 0.0  # time.monotonic() 기준, 0이면 닫힘
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """호출 허용 여부. half-open 시험 호출 중에는 다른 호출을 계속 차단"""
+        if not self._open_until:
+            return True
+        with self._lock:
+            if not self._open_until:
+                return True
+            now = time.monotonic()
+            if now < self._open_until:
+                return False
+            self._open_until = now + self.open_sec
+            return True
+
+    def record_success(self) -> None:
+        if self._failures or self._open_until:
+            with self._lock:
+                if self._open_until:
+                    logger.info(f"✅ {self.name} circuit closed.")
+                self._failures = 0
+                self._open_until = 0.0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                if not self._open_until:
+                    logger.warning(f"🚧 {self.name} circuit opened for {self.open_sec:.0f}s after {self._failures} consecutive failures.")
+                self._open_until = time.monotonic() + self.open_sec
+
+
+class KisHttp:
+    """
+    KIS REST 호출 공통 계층
+    - 토큰 버킷 기반 요청 간격 제한 (KisFetcher/KisService가 같은 계좌 TPS 한도를 공유)
+    - 초당 거래건수 제한 응답 판별 및 재시도
+    - 공유 세션으로 KIS 호스트 연결 재사용
+    """
+    _session = _build_session()
+    _req_lock = threading.Lock()
+    # 토큰 버킷: 짧은 버스트는 허용하고 장기 TPS는 refill_rate로 제한 (모의투자 2TPS / 실전 20TPS 한도에 맞춰 설정)
+    _bucket_capacity = Config.KIS_RATE_BURST
+    _refill_rate = Config.KIS_RATE_PER_SEC  # tokens/sec
+    _tokens = Config.KIS_RATE_BURST
+    _bucket_ts = 0.0
+    # (appkey, appsecret, 고정 헤더) — 앱키가 바뀌지 않는 한 재사용
+    _header_template = None
+    # (token, {tr_id: headers}) — 토큰이 바뀌면 튜플째 교체되어 이전 토큰 헤더가 함께 폐기됨
+    _headers_state = ("", {})
+    # (authorization, {(url, tr_id): (PreparedRequest, send 설정)}) — POST 요청 준비(URL 파싱/헤더 정규화)를 1회만 수행
+    _prepared_state = ("", {})
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        """KIS 호스트 공용 keep-alive 세션 (토큰/접속키 발급 등 재시도 계층을 거치지 않는 호출용)"""
+        return cls._session
+
+    @classmethod
+    def build_headers(cls, token: str, tr_id: str) -> dict:
+        """KIS API 공통 헤더 조회. (token, tr_id)별로 한 번만 만들고 재사용합니다.
+        반환 dict는 여러 호출이 공유하므로 호출 측에서 수정하지 않습니다.
+        """
+        state_token, cache = cls._headers_state
+        if state_token == token:
+            headers = cache.get(tr_id)
+            if headers is not None:
+                return headers
+        else:
+            cache = {}
+            cls._headers_state = (token, cache)
+        template = cls._header_template
+        if template is None or template[0] != Config.KIS_APP_KEY or template[1] != Config.KIS_APP_SECRET:
+            template = (Config.KIS_APP_KEY, Config.KIS_APP_SECRET, MappingProxyType({
+                "content-type": "application/json; charset=utf-8",
+                "appkey": Config.KIS_APP_KEY,
+                "appsecret": Config.KIS_APP_SECRET,
+                "custtype": "P",
+            }))
+            cls._header_template = template
+        headers = dict(template[2])
+        headers["authorization"] = f"Bearer {token}"
+        headers["tr_id"] = tr_id
+        cache[tr_id] = headers
+        return headers
+
+    @classmethod
+    def throttle(cls) -> None:
+        """토큰 버킷 기반 요청 간격 제한.
+        락 안에서는 토큰 예약만 하고, 대기(sleep)는 락 밖에서 수행해 다른 스레드를 막지 않습니다.
+        """
+        with cls._req_lock:
+            now = time.monotonic()
+            cls._tokens = min(cls._bucket_capacity, cls._tokens + (now - cls._bucket_ts) * cls._refill_rate)
+            cls._bucket_ts = now
+            cls._tokens -= 1.0
+            wait = -cls._tokens / cls._refill_rate if cls._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    @classmethod
+    def is_rate_limited(cls, response: requests.Response, idempotent: bool = True) -> bool:
+        """초당 거래건수 제한 응답인지 확인.
+        idempotent=False(주문)이면 HTTP 상태만으로 판단하지 않고 응답 본문의 제한 코드를 확인합니다.
+        """
+        if idempotent and (response.status_code == 429 or response.status_code >= 500):
+            return True
+        head = (response.content or b"")[:_RATE_LIMIT_SCAN_BYTES]
+        return _RATE_LIMIT_MSG_BYTES in head or _RATE_LIMIT_CODE_BYTES in head
+
+    @classmethod
+    def get_with_retry(cls, url: str, headers: dict, params: dict, timeout: Timeout = None, retries: int = 4) -> Optional[requests.Response]:
+        """조회용 GET. 제한 응답/네트워크 오류 시 재시도하고 마지막 응답(없으면 None)을 반환"""
+        if timeout is None:
+            timeout = REQUEST_TIMEOUT_DEFAULT
+        last_response = None
+        for attempt in range(retries):
+            cls.throttle()
+            try:
+                response = cls._session.get(url, headers=headers, params=params, timeout=timeout)
+                last_response = response
+                if not cls.is_rate_limited(response):
+                    return response
+                wait_sec = retry_delay(attempt, response)
+                if attempt < retries - 1:
+                    logger.warning(f"⏳ TPS limit hit. retry {attempt + 1}/{retries} in {wait_sec:.1f}s...")
+            except Exception:
+                wait_sec = retry_delay(attempt, base=RETRY_BASE_SEC / 2)
+            if attempt < retries - 1:
+                time.sleep(wait_sec)
+        return last_response
+
+    @classmethod
+    def _prepare_post(cls, url: str, headers: dict, data: bytes) -> tuple:
+        """(url, tr_id)별로 준비해 둔 POST 요청을 복사해 body만 채워 반환 (토큰이 바뀌면 캐시 폐기).
+        반환: (PreparedRequest, send 설정). Session.send는 환경 변수(REQUESTS_CA_BUNDLE 등)를 반영하지 않으므로
+        Session.request와 같은 verify/proxies/cert 설정을 템플릿과 함께 1회 계산해 둡니다.
+        """
+        auth = headers.get("authorization", "")
+        state_auth, cache = cls._prepared_state
+        if state_auth != auth:
+            cache = {}
+            cls._prepared_state = (auth, cache)
+        key = (url, headers.get("tr_id"))
+        entry = cache.get(key)
+        if entry is None:
+            template = cls._session.prepare_request(requests.Request("POST", url, headers=headers))
+            settings = cls._session.merge_environment_settings(template.url, {}, None, None, None)
+            entry = (template, settings)
+            cache[key] = entry
+        template, settings = entry
+        # 템플릿은 스레드 간 공유되므로 복사본에만 body를 설정
+        prepared = template.copy()
+        prepared.body = data
+        prepared.headers["Content-Length"] = str(len(data))
+        return prepared, settings
+
+    @classmethod
+    def post_with_retry(cls, url: str, headers: dict, body: dict, timeout: Timeout = None, retries: int = 3, log_tag: str = "POST") -> requests.Response:
+        """주문용 POST. 초당 거래건수 제한 응답일 때만 재시도합니다.
+        네트워크 오류는 주문이 이미 접수되었을 수 있으므로 재시도하지 않고 그대로 전파합니다.
+        """
+        if timeout is None:
+            timeout = REQUEST_TIMEOUT_DEFAULT
+        data = fast_json.dumps_bytes(body)
+        response = None
+        for attempt in range(retries):
+            cls.throttle()
+            prepared, settings = cls._prepare_post(url, headers, data)
+            response = cls._session.send(prepared, timeout=timeout, **settings)
+            if not cls.is_rate_limited(response, idempotent=False):
+                return response
+            if attempt < retries - 1:
+                wait_sec = retry_delay(attempt, response)
+                logger.warning(f"⏳ {log_tag} TPS limit hit. retry {attempt + 1}/{retries} in {wait_sec:.1f}s...")
+                time.sleep(wait_sec)
+        return response
@@ -1,58 +1,173 @@
+import asyncio
 import requests
-import json
 import time
 import os
+import random
+import re
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
 from datetime import datetime
 from typing import Optional
 from config import Config
+from services.kis.kis_http import CircuitBreaker, KisHttp, retry_delay
+from services.kis.fetch.kis_fetcher import KisFetcher
 from services.market.market_hour_service import MarketHourService
+from utils import fast_json
 from utils.logger import get_logger
 from utils.market import is_kr
 
+try:
+    import fcntl
+except ImportError:  # Windows 등 → 프로세스 간 잠금 없이 동작
+    fcntl = None
+
 logger = get_logger("kis_service")
 
 # KIS API 상수
-KIS_RATE_LIMIT_MSG_CD = "EGW00201"
-TOKEN_REQUEST_TIMEOUT = 5
-BALANCE_REQUEST_TIMEOUT = 8
-ORDER_REQUEST_TIMEOUT = 10
-MAX_BALANCE_RETRIES = 3
+# (connect, read) 타임아웃 — 연결은 TCP SYN 재전송 경계(3s) 직후 포기, 읽기는 엔드포인트별 상한
+CONNECT_TIMEOUT = 3.05
+TOKEN_REQUEST_TIMEOUT = (CONNECT_TIMEOUT, 5)
+BALANCE_REQUEST_TIMEOUT = (CONNECT_TIMEOUT, 8)
+ORDER_REQUEST_TIMEOUT = (CONNECT_TIMEOUT, 10)
+MAX_BALANCE_RETRIES = 4
+# 제한 응답이 아닌 rt_cd 업무 오류 추가 재시도 횟수
+BALANCE_BUSINESS_RETRIES = 2
+MAX_ORDER_RETRIES = 3
+ORDER_CIRCUIT_OPEN_MSG = "KIS 주문 API 연속 오류로 일시 차단됨 (잠시 후 재시도)"
+# 해외 잔고 조회 TR ID 후보 (모의/실전별, 앞쪽이 현행 TR)
+OVERSEAS_BALANCE_TR_IDS_VTS = ("VTTS3012R", "VTTT3012R")
+OVERSEAS_BALANCE_TR_IDS_REAL = ("TTTS3012R", "TTTT3012R")
+# 가용 현금 조회 시 ITEM_CD용 해외 잔고 재사용 허용 시간
+OVERSEAS_BALANCE_REUSE_SEC = 30
+# 일괄 주문 동시 전송 수 (실제 송신 속도는 KisHttp 토큰 버킷이 제한하므로 RTT 대기만 겹침)
+ORDER_BATCH_WORKERS = 5
+_order_pool = ThreadPoolExecutor(max_workers=ORDER_BATCH_WORKERS, thread_name_prefix="kis-order")
+# 단건 주문/잔고 조회(라우터 async 래퍼, get_all_balances)용 별도 풀 — 일괄 주문 대기열 뒤에서 기다리지 않도록 분리
+INTERACTIVE_WORKERS = 3
+_interactive_pool = ThreadPoolExecutor(max_workers=INTERACTIVE_WORKERS, thread_name_prefix="kis-interactive")
+# 발급 응답에 expires_in이 없거나 해석할 수 없을 때 사용할 토큰 유효 시간
+TOKEN_TTL_SEC = 2 * 60 * 60
+# 만료 직전 토큰으로 요청하지 않도록 메모리 캐시는 여유를 두고 갱신
+TOKEN_EXPIRY_MARGIN_SEC = 60
+# 만료 5분 전 백그라운드에서 선갱신 (요청 경로가 토큰 발급 HTTP를 기다리지 않도록)
+TOKEN_REFRESH_AHEAD_SEC = 5 * 60
+# 선갱신 시점 지터 (여러 워커가 같은 세션 파일 토큰을 읽었을 때 동시에 갱신을 시도하지 않도록 분산)
+TOKEN_REFRESH_JITTER_SEC = 5 * 60
+TOKEN_CACHE_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'data', 'kis_token.json'))
+TOKEN_CACHE_DIR = os.path.dirname(TOKEN_CACHE_PATH)
+TOKEN_LOCK_PATH = f"{TOKEN_CACHE_PATH}.lock"
+# 토큰 디렉터리 생성 여부 (import 시점이 아닌 첫 잠금/저장 시 생성)
+_token_cache_dir_ready = False
+# 국내 잔고 조회 고정 파라미터 (계좌 필드 제외)
+BALANCE_PARAMS_STATIC = {
+    "AFHR_FLPR_YN": "N",
+    "OFL_YN": "N",
+    "INQR_DVSN": "02",
+    "UNPR_DVSN": "01",
+    "FUND_STTL_ICLD_YN": "N",
+    "FNCG_AMT_AUTO_RDPT_YN": "N",
+    "PRCS_DVSN": "00",
+    "CTX_AREA_FK100": "",
+    "CTX_AREA_NK100": "",
+}
+# 해외 잔고/매수가능금액 조회, 해외 주문 고정 필드 (계좌 필드 제외)
+OVERSEAS_BALANCE_PARAMS_STATIC = {
+    "OVRS_EXCG_CD": "NASD",
+    "TR_CRCY_CD": "USD",
+    "CTX_AREA_FK200": "",
+    "CTX_AREA_NK200": "",
+}
+OVERSEAS_PSAMOUNT_PARAMS_STATIC = {
+    "OVRS_EXCG_CD": "NASD",
+    "OVRS_CRCY_CD": "USD",
+    "OVRS_ORD_UNPR": "0",
+}
+OVERSEAS_ORDER_BODY_STATIC = {
+    "ORD_SVR_DVSN_CD": "0",
+    "ORD_DVSN": "00",
+}
+# 고정 엔드포인트 URL (KIS_BASE_URL은 프로세스 시작 시 환경변수로 결정되므로 import 시 1회 계산)
+TOKEN_URL = f"{Config.KIS_BASE_URL}/oauth2/tokenP"
+DOMESTIC_BALANCE_URL = f"{Config.KIS_BASE_URL}/uapi/domestic-stock/v1/trading/inquire-balance"
+OVERSEAS_BALANCE_URL = f"{Config.KIS_BASE_URL}/uapi/overseas-stock/v1/trading/inquire-balance"
+OVERSEAS_PSAMOUNT_URL = f"{Config.KIS_BASE_URL}/uapi/overseas-stock/v1/trading/inquire-psamount"
+DOMESTIC_ORDER_URL = f"{Config.KIS_BASE_URL}/uapi/domestic-stock/v1/trading/order-cash"
+OVERSEAS_ORDER_URL = f"{Config.KIS_BASE_URL}/uapi/overseas-stock/v1/trading/order"
+
+# 해외 종목 코드 허용 문자 (영문/숫자 및 BRK.B, BRK/B 같은 클래스 구분자)
+_OVERSEAS_TICKER_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9./-]*")
+# 계좌번호에서 숫자 외 문자(하이픈/공백 등) 제거용
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+# 주문 수량/국내 지정가 문자열 변환용 (반복되는 소량 주문 수량은 미리 만든 문자열 재사용)
+_SMALL_INT_STR = tuple(str(i) for i in range(1001))
+
+
+def _token_ttl_sec(token_data: dict) -> int:
+    """발급 응답의 expires_in(초)을 토큰 유효 시간으로 사용 (KIS 기본 86400). 없거나 잘못되면 TOKEN_TTL_SEC"""
+    try:
+        ttl = int(token_data.get("expires_in") or 0)
+    except (TypeError, ValueError):
+        ttl = 0
+    return ttl if ttl > TOKEN_EXPIRY_MARGIN_SEC else TOKEN_TTL_SEC
+
+
+def _int_str(value) -> str:
+    """주문 필드용 정수 문자열. 0~1000 int는 테이블에서 조회, 그 외는 str()"""
+    if type(value) is int and 0 <= value <= 1000:
+        return _SMALL_INT_STR[value]
+    return str(value)
+
+
+def _ensure_token_cache_dir() -> None:
+    """세션 파일/잠금 파일 디렉터리를 첫 쓰기(잠금) 직전에 1회 생성"""
+    global _token_cache_dir_ready
+    if not _token_cache_dir_ready:
+        os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
+        _token_cache_dir_ready = True
+
+
+@contextmanager
+def _token_file_lock():
+    """여러 워커 프로세스가 동시에 토큰을 발급하지 않도록 세션 파일 잠금 (fcntl 미지원 환경은 생략)"""
+    if fcntl is None:
+        yield
+        return
+    _ensure_token_cache_dir()
+    with open(TOKEN_LOCK_PATH, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 
 class KisService:
     """
     한국투자증권 API 연동 서비스
     """
-    _access_token = None
-    _token_expiry = None
+    # (token, deadline) — deadline은 time.monotonic() 기준 메모리 캐시 만료 시각.
+    # 튜플 하나로 교체하므로 락 없는 빠른 경로에서도 토큰과 만료 시각이 어긋나 보이지 않음
+    _token_state = (None, 0.0)
+    _token_expiry_ts = 0.0  # epoch seconds (세션 파일 저장용, _token_lock 보유 시에만 접근)
+    _token_lock = threading.Lock()
+    _refresh_timer = None
+    # 마지막으로 읽거나 쓴 세션 파일의 (mtime_ns, size) — 바뀌지 않았으면 재파싱 생략
+    _token_file_sig = None
     _last_balance_data = None
-    _req_lock = threading.Lock()
-    _last_req_ts = 0.0
-    _min_req_interval = 0.55  # VTS 기준 약 2TPS 제한 대응
-    
-    @classmethod
-    def _throttle_request(cls) -> None:
-        """요청 간격 제한 (초당 거래건수 준수)"""
-        with cls._req_lock:
-            now = time.time()
-            elapsed = now - cls._last_req_ts
-            if elapsed < cls._min_req_interval:
-                sleep_time = cls._min_req_interval - elapsed
-                time.sleep(sleep_time)
-            cls._last_req_ts = time.time()
-    
-    @classmethod
-    def _is_rate_limited_response(cls, response: requests.Response) -> bool:
-        """초당 거래건수 제한 응답인지 확인"""
-        if response.status_code in (429, 500):
-            try:
-                body = response.json()
-                if body.get("msg_cd") == KIS_RATE_LIMIT_MSG_CD or "초당 거래건수" in (body.get("msg1") or ""):
-                    return True
-            except Exception:
-                pass
-        return False
+    # KIS 장애 시 재시도 대기로 호출 스레드를 붙잡지 않도록 연속 실패 시 일시 차단
+    _balance_breaker = CircuitBreaker("KIS balance")
+    _order_breaker = CircuitBreaker("KIS order")
+    # 마지막 해외 잔고 조회 결과와 시각(time.monotonic()) — 가용 현금 조회 시 ITEM_CD 용도로 짧게 재사용
+    _last_overseas_balance_data = None
+    _last_overseas_balance_ts = 0.0
+    # 마지막으로 성공한 해외 잔고 TR ID — 이후 호출은 이 TR부터 시도
+    _overseas_balance_tr_id = None
+    # ((cano, acnt_prdt_cd), {이름: 요청 템플릿}) — 계좌가 바뀌면 튜플째 교체 (템플릿은 읽기 전용으로 공유)
+    _templates_state = (None, {})
+    # (KIS_ACCOUNT_NO 원문, (CANO, ACNT_PRDT_CD)) — 설정값이 바뀌지 않으면 재파싱하지 않음
+    _account_parts_cache = None
 
     @classmethod
     def _get_account_parts(cls) -> tuple[str, str]:
@@ -61,62 +176,193 @@ class KisService:
         - 입력 허용: 50162391-01 / 5016239101 / 50162391
         - 반환: (CANO(8), ACNT_PRDT_CD(2))
         """
-        raw = (Config.KIS_ACCOUNT_NO or "").strip()
-        digits = "".join(ch for ch in raw if ch.isdigit())
+        account_no = Config.KIS_ACCOUNT_NO
+        cached = cls._account_parts_cache
+        if cached is not None and cached[0] == account_no:
+            return cached[1]
+        raw = (account_no or "").strip()
+        digits = _NON_DIGIT_RE.sub("", raw)
         if len(digits) >= 10:
-            return digits[:8], digits[8:10]
-        if len(digits) == 8:
-            return digits, "01"
-        logger.error(f"❌ Invalid KIS_ACCOUNT_NO format: '{raw}'")
-        return "", "01"
+            parts = (digits[:8], digits[8:10])
+        elif len(digits) == 8:
+            parts = (digits, "01")
+        else:
+            # 잘못된 형식은 캐시하지 않아 호출마다 오류 로그를 남김
+            logger.error(f"❌ Invalid KIS_ACCOUNT_NO format: '{raw}'")
+            return "", "01"
+        cls._account_parts_cache = (account_no, parts)
+        return parts
+
+    @classmethod
+    def reset_account_cache(cls) -> None:
+        """계좌번호 파싱 캐시 초기화 (설정 변경/테스트용)"""
+        cls._account_parts_cache = None
+
+    @staticmethod
+    def _build_templates(cano: str, acnt_prdt_cd: str) -> dict:
+        """계좌별 고정 요청 파라미터/주문 본문 템플릿 생성 (호출 측은 복사해 가변 필드만 채움)"""
+        account = {"CANO": cano, "ACNT_PRDT_CD": acnt_prdt_cd}
+        return {
+            "balance": {**account, **BALANCE_PARAMS_STATIC},
+            "overseas_balance": {**account, **OVERSEAS_BALANCE_PARAMS_STATIC},
+            "overseas_psamount": {**account, **OVERSEAS_PSAMOUNT_PARAMS_STATIC},
+            "domestic_order": account,
+            "overseas_order": {**account, **OVERSEAS_ORDER_BODY_STATIC},
+        }
+
+    @classmethod
+    def _get_templates(cls) -> Optional[dict]:
+        """현재 계좌의 요청 템플릿 조회. 계좌번호가 잘못되었으면 None"""
+        parts = cls._get_account_parts()
+        if not parts[0]:
+            return None
+        state_parts, templates = cls._templates_state
+        if state_parts != parts:
+            templates = cls._build_templates(*parts)
+            cls._templates_state = (parts, templates)
+        return templates
+
+    @classmethod
+    def _get_tr_id(cls, api_name: str) -> Optional[str]:
+        """현재 환경(모의/실전)의 TR ID 조회 (StockMetaService.get_api_info 캐시 사용)"""
+        from services.market.stock_meta_service import StockMetaService
+        tr_id, _ = StockMetaService.get_api_info(api_name, is_vts=Config.KIS_IS_VTS)
+        return tr_id
+
+    @classmethod
+    def reset_templates(cls) -> None:
+        """요청 템플릿 캐시 초기화 (설정 변경/테스트용)"""
+        cls._templates_state = (None, {})
     
     @classmethod
     def get_access_token(cls) -> str:
         """접근 토큰 발급 및 갱신 (파일 기반 캐시 적용)"""
-        token_cache_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'kis_token.json')
-        
-        # 1. 메모리 캐시 확인
-        if cls._access_token and cls._token_expiry and datetime.now() < cls._token_expiry:
-            return cls._access_token
-            
-        if os.path.exists(token_cache_path):
+        # 1. 메모리 캐시 확인 (락 없이 빠른 경로)
+        token, deadline = cls._token_state
+        if token and time.monotonic() < deadline:
+            return token
+
+        with cls._token_lock:
+            # 락 대기 중 다른 스레드가 이미 갱신했을 수 있으므로 재확인
+            token, deadline = cls._token_state
+            if token and time.monotonic() < deadline:
+                return token
+            with _token_file_lock():
+                # 다른 프로세스가 먼저 발급했다면 파일에서 읽어 재사용
+                if cls._load_token_file():
+                    return cls._token_state[0]
+                return cls._issue_access_token()
+
+    @classmethod
+    def preload_token(cls) -> bool:
+        """프로세스 시작 시 세션 파일의 토큰을 미리 적재 (첫 요청이 디스크/HTTP를 기다리지 않도록)"""
+        with cls._token_lock, _token_file_lock():
+            return cls._load_token_file()
+
+    @classmethod
+    def _set_token(cls, token: str, expiry_ts: float, remaining: float) -> None:
+        """메모리 토큰 교체 후 선갱신 예약 (_token_lock 보유 상태에서 호출)"""
+        cls._token_expiry_ts = expiry_ts
+        cls._token_state = (token, time.monotonic() + remaining)
+        cls._schedule_refresh()
+
+    @classmethod
+    def _schedule_refresh(cls) -> None:
+        """만료 TOKEN_REFRESH_AHEAD_SEC(+지터) 전에 백그라운드 갱신 예약 (_token_lock 보유 상태에서 호출)
+        먼저 깨어난 워커가 발급해 세션 파일에 저장하면 나머지는 파일에서 읽어 재사용합니다.
+        """
+        if cls._refresh_timer is not None:
+            cls._refresh_timer.cancel()
+        ahead = TOKEN_REFRESH_AHEAD_SEC + random.uniform(0, TOKEN_REFRESH_JITTER_SEC)
+        delay = max(cls._token_state[1] - time.monotonic() - ahead, 0.0)
+        timer = threading.Timer(delay, cls._refresh_token_in_background)
+        timer.daemon = True
+        timer.start()
+        cls._refresh_timer = timer
+
+    @classmethod
+    def _refresh_token_in_background(cls) -> None:
+        """예약된 토큰 선갱신. 실패해도 기존 토큰은 deadline까지 유효하므로 경고만 남김"""
+        try:
+            with cls._token_lock, _token_file_lock():
+                # 다른 프로세스가 이미 더 새 토큰을 저장했다면 그것을 사용
+                if not cls._load_token_file(min_expiry_ts=cls._token_expiry_ts):
+                    cls._issue_access_token()
+        except Exception as e:
+            logger.warning(f"⚠️ Background token refresh failed: {e}")
+
+    @classmethod
+    def _load_token_file(cls, min_expiry_ts: float = 0.0) -> bool:
+        """세션 파일에 유효한 토큰(만료 시각 > min_expiry_ts)이 있으면 메모리 캐시에 적재"""
+        try:
+            with open(TOKEN_CACHE_PATH, "rb") as f:
+                stat = os.fstat(f.fileno())
+                sig = (stat.st_mtime_ns, stat.st_size)
+                if sig == cls._token_file_sig:
+                    # 이미 반영한 파일 (그 토큰이 만료되어 여기까지 온 것이므로 다시 읽을 필요 없음)
+                    return False
+                token_cache = fast_json.loads(f.read())
+            cls._token_file_sig = sig
+            expiry_ts = token_cache.get("expiry_ts")
+            if expiry_ts is None:
+                # 구버전 파일 (ISO 문자열만 저장)
+                expiry_ts = datetime.fromisoformat(token_cache["expiry"]).timestamp()
+            # 남은 유효 시간(wall-clock)을 monotonic 기준 만료 시각으로 환산
+            remaining = expiry_ts - time.time() - TOKEN_EXPIRY_MARGIN_SEC
+            if remaining > 0 and expiry_ts > min_expiry_ts:
+                cls._set_token(token_cache["token"], expiry_ts, remaining)
+                logger.info("📄 KIS Access Token loaded from session file.")
+                return True
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"token cache unreadable: {e}")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            # 손상/형식 불일치 파일은 삭제해 매 호출마다 파싱 실패가 반복되지 않도록 함 (다음 발급 시 재작성)
+            logger.debug(f"token cache invalid, removing: {e}")
             try:
-                with open(token_cache_path, "r") as f:
-                    token_cache = json.load(f)
-                    expiry = datetime.fromisoformat(token_cache["expiry"])
-                    if datetime.now() < expiry:
-                        cls._access_token = token_cache["token"]
-                        cls._token_expiry = expiry
-                        logger.info("📄 KIS Access Token loaded from session file.")
-                        return cls._access_token
-            except Exception:
+                os.remove(TOKEN_CACHE_PATH)
+            except OSError:
                 pass
+        return False
 
-        url = f"{Config.KIS_BASE_URL}/oauth2/tokenP"
-        headers = {"content-type": "application/json; charset=utf-8"}
+    @classmethod
+    def _issue_access_token(cls) -> str:
+        """신규 토큰 발급 후 세션 파일에 원자적으로 저장 (_token_lock 보유 상태에서 호출)"""
+        url = TOKEN_URL
         body = {
             "grant_type": "client_credentials",
             "appkey": Config.KIS_APP_KEY,
             "appsecret": Config.KIS_APP_SECRET
         }
         try:
-            response = requests.post(url, json=body, timeout=TOKEN_REQUEST_TIMEOUT)
+            response = KisHttp.session().post(
+                url,
+                headers={"content-type": "application/json; charset=utf-8"},
+                data=fast_json.dumps_bytes(body),
+                timeout=TOKEN_REQUEST_TIMEOUT,
+            )
             response.raise_for_status()
-            token_data = response.json()
-            cls._access_token = token_data["access_token"]
-            from datetime import timedelta
-            cls._token_expiry = datetime.now() + timedelta(hours=2)
+            token_data = fast_json.loads(response.content)
+            token = token_data["access_token"]
+            ttl = _token_ttl_sec(token_data)
+            cls._set_token(token, time.time() + ttl, ttl - TOKEN_EXPIRY_MARGIN_SEC)
             
-            # 파일 캐시 저장
-            os.makedirs(os.path.dirname(token_cache_path), exist_ok=True)
-            with open(token_cache_path, 'w') as f:
-                json.dump({
-                    "token": cls._access_token,
-                    "expiry": cls._token_expiry.isoformat()
-                }, f)
+            # 파일 캐시 저장 (임시 파일에 쓴 뒤 교체하여 부분 기록 방지)
+            _ensure_token_cache_dir()
+            tmp_path = f"{TOKEN_CACHE_PATH}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(fast_json.dumps_bytes({
+                    "token": token,
+                    "expiry_ts": cls._token_expiry_ts,
+                    "expiry": datetime.fromtimestamp(cls._token_expiry_ts).isoformat()
+                }))
+            os.replace(tmp_path, TOKEN_CACHE_PATH)
+            stat = os.stat(TOKEN_CACHE_PATH)
+            cls._token_file_sig = (stat.st_mtime_ns, stat.st_size)
                 
             logger.info("🔑 KIS Access Token issued and saved to file.")
-            return cls._access_token
+            return token
         except Exception as e:
             logger.error(f"❌ Failed to get access token: {e}")
             raise
@@ -124,75 +370,57 @@ class KisService:
     @classmethod
     def get_headers(cls, tr_id: str) -> dict:
         """API 공통 헤더 생성"""
-        token = cls.get_access_token()
-        return {
-            "content-type": "application/json; charset=utf-8",
-            "authorization": f"Bearer {token}",
-            "appkey": Config.KIS_APP_KEY,
-            "appsecret": Config.KIS_APP_SECRET,
-            "tr_id": tr_id
-        }
+        return KisHttp.build_headers(cls.get_access_token(), tr_id)
 
     @classmethod
     def get_balance(cls) -> Optional[dict]:
         """주식 잔고 조회 (국내 모의투자 기준)"""
-        cano, acnt_prdt_cd = cls._get_account_parts()
-        if not cano:
+        templates = cls._get_templates()
+        if templates is None:
             return None
 
-        from services.market.stock_meta_service import StockMetaService
-        tr_id, _ = StockMetaService.get_api_info("주식잔고조회")
-        url = f"{Config.KIS_BASE_URL}/uapi/domestic-stock/v1/trading/inquire-balance"
+        tr_id = cls._get_tr_id("주식잔고조회")
+        url = DOMESTIC_BALANCE_URL
         headers = cls.get_headers(tr_id)
-        
-        params = {
-            "CANO": cano,
-            "ACNT_PRDT_CD": acnt_prdt_cd,
-            "AFHR_FLPR_YN": "N",
-            "OFL_YN": "N",
-            "INQR_DVSN": "02",
-            "UNPR_DVSN": "01",
-            "FUND_STTL_ICLD_YN": "N",
-            "FNCG_AMT_AUTO_RDPT_YN": "N",
-            "PRCS_DVSN": "00",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": ""
-        }
-        
+        # requests는 params dict를 수정하지 않으므로 템플릿을 그대로 전달
+        params = templates["balance"]
+
         last_err = None
-        for attempt in range(MAX_BALANCE_RETRIES):
-            try:
-                response = requests.get(url, headers=headers, params=params, timeout=BALANCE_REQUEST_TIMEOUT)
-                if response.status_code >= 500:
-                    last_err = f"HTTP {response.status_code}: {response.text[:200]}"
-                    logger.warning(
-                        f"⏳ Balance API {response.status_code} (attempt {attempt + 1}/{MAX_BALANCE_RETRIES}). retrying..."
-                    )
-                    time.sleep(1.2 * (attempt + 1))
-                    continue
-                response.raise_for_status()
-                response_data = response.json()
-                if response_data.get("rt_cd") != "0":
+        if not cls._balance_breaker.allow():
+            last_err = "circuit open (recent consecutive failures)"
+        else:
+            # 제한(EGW00201)/5xx 재시도는 get_with_retry가 담당. 그 외 rt_cd 업무 오류는 일시적인 경우가 있어 짧게 재시도
+            for attempt in range(BALANCE_BUSINESS_RETRIES + 1):
+                try:
+                    response = KisHttp.get_with_retry(url, headers=headers, params=params, timeout=BALANCE_REQUEST_TIMEOUT, retries=MAX_BALANCE_RETRIES)
+                    if response is None:
+                        last_err = "no response"
+                        break
+                    if response.status_code != 200:
+                        last_err = f"HTTP {response.status_code}: {response.text[:200]}"
+                        break
+                    response_data = fast_json.loads(response.content)
+                    if response_data.get("rt_cd") == "0":
+                        result = {
+                            "holdings": response_data.get("output1", []),
+                            "summary": response_data.get("output2", [])
+                        }
+                        cls._last_balance_data = result
+                        cls._balance_breaker.record_success()
+                        return result
                     msg = response_data.get("msg1") or response_data.get("msg_cd") or "unknown"
                     last_err = f"KIS rt_cd={response_data.get('rt_cd')}, msg={msg}"
-                    if attempt < MAX_BALANCE_RETRIES - 1:
-                        logger.warning(
-                            f"⏳ Balance business error (attempt {attempt + 1}/{MAX_BALANCE_RETRIES}): {msg}. retrying..."
-                        )
-                        time.sleep(1.0 * (attempt + 1))
-                        continue
-                    logger.error(f"❌ Balance fetch failed after retries: {msg}")
+                except Exception as e:
+                    last_err = e
                     break
-                result = {
-                    "holdings": response_data.get("output1", []),
-                    "summary": response_data.get("output2", [])
-                }
-                cls._last_balance_data = result
-                return result
-            except Exception as e:
-                last_err = e
-                time.sleep(1.2 * (attempt + 1))
-        
+                if attempt < BALANCE_BUSINESS_RETRIES:
+                    wait_sec = retry_delay(attempt)
+                    logger.warning(
+                        f"⏳ Balance business error (attempt {attempt + 1}/{BALANCE_BUSINESS_RETRIES + 1}): {msg}. retrying in {wait_sec:.1f}s..."
+                    )
+                    time.sleep(wait_sec)
+            cls._balance_breaker.record_failure()
+
         logger.error(f"❌ Error fetching balance after retries: {last_err}")
         if cls._last_balance_data:
             logger.warning("⚠️ Using last successful balance response as fallback.")
@@ -202,34 +430,33 @@ class KisService:
     @classmethod
     def get_overseas_balance(cls) -> Optional[dict]:
         """해외 주식 잔고 조회 (실패 시 None)"""
-        cano, acnt_prdt_cd = cls._get_account_parts()
-        if not cano:
+        templates = cls._get_templates()
+        if templates is None:
             return None
 
-        url = f"{Config.KIS_BASE_URL}/uapi/overseas-stock/v1/trading/inquire-balance"
-        tr_ids = ["VTTS3012R", "TTTS3012R", "VTTT3012R", "TTTT3012R"]
-        params = {
-            "CANO": cano,
-            "ACNT_PRDT_CD": acnt_prdt_cd,
-            "OVRS_EXCG_CD": "NASD",
-            "TR_CRCY_CD": "USD",
-            "CTX_AREA_FK200": "",
-            "CTX_AREA_NK200": ""
-        }
+        url = OVERSEAS_BALANCE_URL
+        tr_ids = OVERSEAS_BALANCE_TR_IDS_VTS if Config.KIS_IS_VTS else OVERSEAS_BALANCE_TR_IDS_REAL
+        if cls._overseas_balance_tr_id in tr_ids:
+            tr_ids = (cls._overseas_balance_tr_id,) + tuple(t for t in tr_ids if t != cls._overseas_balance_tr_id)
+        params = templates["overseas_balance"]
 
         for tr_id in tr_ids:
             try:
                 headers = cls.get_headers(tr_id)
-                response = requests.get(url, headers=headers, params=params, timeout=BALANCE_REQUEST_TIMEOUT)
-                if response.status_code >= 500:
+                response = KisHttp.get_with_retry(url, headers=headers, params=params, timeout=BALANCE_REQUEST_TIMEOUT, retries=1)
+                if response is None or response.status_code >= 500:
                     continue
                 response.raise_for_status()
-                response_data = response.json()
+                response_data = fast_json.loads(response.content)
                 if response_data.get("rt_cd") != "0":
                     continue
                 output1 = response_data.get("output1", []) or []
                 output2 = response_data.get("output2", []) or []
-                return {"holdings": output1, "summary": output2}
+                result = {"holdings": output1, "summary": output2}
+                cls._overseas_balance_tr_id = tr_id
+                cls._last_overseas_balance_data = result
+                cls._last_overseas_balance_ts = time.monotonic()
+                return result
             except Exception:
                 continue
         return None
@@ -237,40 +464,40 @@ class KisService:
     @classmethod
     def get_overseas_available_cash(cls) -> Optional[float]:
         """해외 주식 가용 현금 조회 - 매수가능금액 조회 API 사용 (VTTS3007R)"""
-        cano, acnt_prdt_cd = cls._get_account_parts()
-        if not cano:
+        templates = cls._get_templates()
+        if templates is None:
             return None
 
-        url = f"{Config.KIS_BASE_URL}/uapi/overseas-stock/v1/trading/inquire-psamount"
+        url = OVERSEAS_PSAMOUNT_URL
         tr_id = "VTTS3007R" if Config.KIS_IS_VTS else "TTTS3007R"
         
-        # ITEM_CD 파라미터 필요 - 해외 잔고에서 첫 번째 종목 코드 사용
-        overseas_balance = cls.get_overseas_balance()
-        item_cd = None
-        if overseas_balance and overseas_balance.get("holdings") and len(overseas_balance["holdings"]) > 0:
-            item_cd = overseas_balance["holdings"][0].get("ovrs_pdno")
-        
+        # ITEM_CD 파라미터 필요 - 설정된 조회용 종목(기본 AAPL), 없으면 해외 잔고의 첫 번째 종목 코드 사용
+        item_cd = Config.KIS_USD_CASH_PROBE_TICKER
+        if not item_cd:
+            overseas_balance = cls._last_overseas_balance_data
+            if overseas_balance is None or time.monotonic() - cls._last_overseas_balance_ts >= OVERSEAS_BALANCE_REUSE_SEC:
+                overseas_balance = cls.get_overseas_balance()
+            holdings = (overseas_balance or {}).get("holdings")
+            if holdings:
+                item_cd = holdings[0].get("ovrs_pdno")
+
         if not item_cd:
             logger.warning("⚠️ Cannot get USD available cash: no overseas holdings found")
             return None
         
-        params = {
-            "CANO": cano,
-            "ACNT_PRDT_CD": acnt_prdt_cd,
-            "OVRS_EXCG_CD": "NASD",
-            "OVRS_CRCY_CD": "USD",
-            "OVRS_ORD_UNPR": "0",
-            "ITEM_CD": item_cd
-        }
+        params = {**templates["overseas_psamount"], "ITEM_CD": item_cd}
 
         try:
             headers = cls.get_headers(tr_id)
-            response = requests.get(url, headers=headers, params=params, timeout=BALANCE_REQUEST_TIMEOUT)
+            response = KisHttp.get_with_retry(url, headers=headers, params=params, timeout=BALANCE_REQUEST_TIMEOUT, retries=2)
+            if response is None:
+                logger.warning("⚠️ Overseas available cash API no response")
+                return None
             if response.status_code >= 500:
                 logger.warning(f"⚠️ Overseas available cash API HTTP {response.status_code}")
                 return None
             response.raise_for_status()
-            response_data = response.json()
+            response_data = fast_json.loads(response.content)
             if response_data.get("rt_cd") != "0":
                 msg = response_data.get("msg1", "")
                 msg_cd = response_data.get("msg_cd", "")
@@ -290,91 +517,80 @@ class KisService:
             logger.error(f"❌ Failed to get overseas available cash: {e}")
         return None
 
+    @classmethod
+    def _record_order_result(cls, response) -> None:
+        """주문 응답으로 서킷 상태 갱신. 주문 거부(rt_cd != 0)는 API가 정상 응답한 것으로 봄"""
+        if response.status_code >= 500 or KisHttp.is_rate_limited(response, idempotent=False):
+            cls._order_breaker.record_failure()
+        else:
+            cls._order_breaker.record_success()
+
+    @staticmethod
+    def _parse_order_body(response) -> dict:
+        """주문 응답 본문을 한 번만 파싱 (JSON이 아니거나 dict가 아니면 빈 dict)"""
+        try:
+            data = fast_json.loads(response.content)
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
     @classmethod
     def _send_domestic_order(cls, ticker: str, quantity: int, tr_id: str, ord_dvsn: str, ord_price: str, log_tag: str) -> dict:
         """국내주식 주문 공통 실행 (초당 거래건수 제한 준수)"""
-        cano, acnt_prdt_cd = cls._get_account_parts()
-        if not cano:
+        templates = cls._get_templates()
+        if templates is None:
             return {"status": "error", "msg": "Invalid KIS_ACCOUNT_NO format"}
 
-        url = f"{Config.KIS_BASE_URL}/uapi/domestic-stock/v1/trading/order-cash"
+        if not cls._order_breaker.allow():
+            logger.error(f"🚧 {log_tag} skipped: order API circuit open")
+            return {"status": "error", "msg": ORDER_CIRCUIT_OPEN_MSG}
+
+        url = DOMESTIC_ORDER_URL
         headers = cls.get_headers(tr_id)
 
         body = {
-            "CANO": cano,
-            "ACNT_PRDT_CD": acnt_prdt_cd,
+            **templates["domestic_order"],
             "PDNO": ticker,
             "ORD_DVSN": ord_dvsn,
-            "ORD_QTY": str(quantity),
-            "ORD_UNPR": ord_price
+            "ORD_QTY": _int_str(quantity),
+            "ORD_UNPR": ord_price,
         }
 
-        # 초당 거래건수 제한 준수를 위한 재시도 로직
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                # Throttle 적용
-                cls._throttle_request()
-                
-                response = requests.post(url, headers=headers, data=json.dumps(body), timeout=ORDER_REQUEST_TIMEOUT)
-                if cls._is_rate_limited_response(response):
-                    wait_sec = 1.2 * (attempt + 1)
-                    logger.warning(f"⏳ {log_tag} TPS limit hit. retry {attempt + 1}/{max_retries} in {wait_sec:.1f}s...")
-                    time.sleep(wait_sec)
-                    continue
-                if response.status_code >= 500:
-                    try:
-                        error_body = response.text
-                        logger.error(f"❌ {log_tag} HTTP {response.status_code} Error. Response body: {error_body}")
-                    except Exception:
-                        pass
-                    response.raise_for_status()
-                response.raise_for_status()
-                data = response.json()
-                if data["rt_cd"] != "0":
-                    msg = data.get("msg1") or data.get("msg_cd") or "unknown"
-                    if data.get("msg_cd") == KIS_RATE_LIMIT_MSG_CD and attempt < max_retries - 1:
-                        wait_sec = 1.2 * (attempt + 1)
-                        logger.warning(f"⏳ {log_tag} TPS limit (rt_cd). retry {attempt + 1}/{max_retries} in {wait_sec:.1f}s...")
-                        time.sleep(wait_sec)
-                        continue
-                    logger.error(f"❌ {log_tag} failed: {msg} (rt_cd: {data.get('rt_cd')})")
-                    return {"status": "failed", "msg": msg}
-
-                logger.info(f"✅ {log_tag} success! {ticker} {quantity}qty")
-                return {"status": "success", "data": data.get('output', {})}
-                
-            except requests.exceptions.HTTPError as e:
-                error_msg = str(e)
-                try:
-                    error_body = e.response.text if hasattr(e, 'response') else ""
-                    # 초당 거래건수 에러인 경우 재시도
-                    if hasattr(e, 'response') and cls._is_rate_limited_response(e.response) and attempt < max_retries - 1:
-                        wait_sec = 1.2 * (attempt + 1)
-                        logger.warning(f"⏳ {log_tag} TPS limit (HTTP). retry {attempt + 1}/{max_retries} in {wait_sec:.1f}s...")
-                        time.sleep(wait_sec)
-                        continue
-                    logger.error(f"❌ Error sending {log_tag}: {error_msg} | Body: {error_body}")
-                except:
-                    logger.error(f"❌ Error sending {log_tag}: {error_msg}")
-                return {"status": "error", "msg": error_msg}
-            except Exception as e:
-                logger.error(f"❌ Error sending {log_tag}: {e}")
-                return {"status": "error", "msg": str(e)}
-        
-        # 모든 재시도 실패
-        logger.error(f"❌ {log_tag} failed after {max_retries} retries")
-        return {"status": "error", "msg": f"Failed after {max_retries} retries due to rate limit"}
+        try:
+            response = KisHttp.post_with_retry(url, headers, body, timeout=ORDER_REQUEST_TIMEOUT, retries=MAX_ORDER_RETRIES, log_tag=log_tag)
+            cls._record_order_result(response)
+            if KisHttp.is_rate_limited(response, idempotent=False):
+                logger.error(f"❌ {log_tag} failed after {MAX_ORDER_RETRIES} retries")
+                return {"status": "error", "msg": f"Failed after {MAX_ORDER_RETRIES} retries due to rate limit"}
+            data = cls._parse_order_body(response)
+            if response.status_code >= 400:
+                logger.error(f"❌ Error sending {log_tag}: HTTP {response.status_code} | Body: {response.text}")
+                return {"status": "error", "msg": data.get("msg1") or f"HTTP {response.status_code}"}
+            if data.get("rt_cd") != "0":
+                msg = data.get("msg1") or data.get("msg_cd") or "unknown"
+                logger.error(f"❌ {log_tag} failed: {msg} (rt_cd: {data.get('rt_cd')})")
+                return {"status": "failed", "msg": msg}
+
+            logger.info(f"✅ {log_tag} success! {ticker} {quantity}qty")
+            return {"status": "success", "data": data.get('output', {})}
+        except requests.exceptions.Timeout as e:
+            cls._order_breaker.record_failure()
+            # 읽기 타임아웃이면 주문이 이미 접수되었을 수 있으므로 재주문 전 잔고/체결 확인 필요
+            logger.error(f"⏱️ {log_tag} timed out: {e}")
+            return {"status": "timeout", "msg": "주문 응답 시간 초과 (체결 여부 확인 필요)"}
+        except Exception as e:
+            cls._order_breaker.record_failure()
+            logger.error(f"❌ Error sending {log_tag}: {e}")
+            return {"status": "error", "msg": str(e)}
 
     @classmethod
     def send_order(cls, ticker: str, quantity: int, price: int = 0, order_type: str = "buy") -> dict:
         """국내 주식 주문 (매수/매도)"""
-        from services.market.stock_meta_service import StockMetaService
         api_name = "주식주문_매수" if order_type == "buy" else "주식주문_매도"
-        tr_id, _ = StockMetaService.get_api_info(api_name)
+        tr_id = cls._get_tr_id(api_name)
 
         ord_dvsn = "00" if price > 0 else "01"
-        ord_price = str(price) if price > 0 else "0"
+        ord_price = _int_str(price) if price > 0 else "0"
         return cls._send_domestic_order(
             ticker=ticker,
             quantity=quantity,
@@ -400,9 +616,8 @@ class KisService:
         if not MarketHourService.is_kr_after_hours_open():
             return {"status": "failed", "msg": "한국 사후장 주문 가능 시간이 아닙니다."}
 
-        from services.market.stock_meta_service import StockMetaService
         api_name = "주식주문_매수" if order_type == "buy" else "주식주문_매도"
-        tr_id, _ = StockMetaService.get_api_info(api_name)
+        tr_id = cls._get_tr_id(api_name)
         ord_dvsn_final = (ord_dvsn or Config.KIS_AFTER_HOURS_ORD_DVSN or "81").strip()
 
         return cls._send_domestic_order(
@@ -427,82 +642,148 @@ class KisService:
     @classmethod
     def send_overseas_order(cls, ticker: str, quantity: int, price: float = 0, order_type: str = "buy", market: str = "NASD") -> dict:
         """해외 주식 주문 (미국 기준, 초당 거래건수 제한 준수)"""
-        cano, acnt_prdt_cd = cls._get_account_parts()
-        if not cano:
+        # 입력 검증을 계좌/TR 조회와 토큰 발급보다 먼저 수행 (잘못된 요청은 네트워크 없이 즉시 반환)
+        if price <= 0:
+            return {"status": "error", "msg": "해외 주식 주문 시 지정가(price)를 입력해야 합니다."}
+        if quantity <= 0:
+            return {"status": "error", "msg": "주문 수량은 1 이상이어야 합니다."}
+        if not ticker or not _OVERSEAS_TICKER_RE.fullmatch(ticker):
+            return {"status": "error", "msg": f"잘못된 해외 종목 코드: {ticker!r}"}
+
+        templates = cls._get_templates()
+        if templates is None:
             return {"status": "error", "msg": "Invalid KIS_ACCOUNT_NO format"}
 
-        from services.market.stock_meta_service import StockMetaService
         api_name = "해외주식_미국매수" if order_type == "buy" else "해외주식_미국매도"
-        tr_id, _ = StockMetaService.get_api_info(api_name)
-        url = f"{Config.KIS_BASE_URL}/uapi/overseas-stock/v1/trading/order"
+        tr_id = cls._get_tr_id(api_name)
+
+        if not cls._order_breaker.allow():
+            logger.error("🚧 Overseas Order skipped: order API circuit open")
+            return {"status": "error", "msg": ORDER_CIRCUIT_OPEN_MSG}
+
+        url = OVERSEAS_ORDER_URL
         headers = cls.get_headers(tr_id)
-        
-        if price <= 0:
-             return {"status": "error", "msg": "해외 주식 주문 시 지정가(price)를 입력해야 합니다."}
 
         body = {
-            "CANO": cano,
-            "ACNT_PRDT_CD": acnt_prdt_cd,
+            **templates["overseas_order"],
             "OVRS_EXCG_CD": market,
             "PDNO": ticker,
-            "ORD_QTY": str(quantity),
+            "ORD_QTY": _int_str(quantity),
             "OVRS_ORD_UNPR": str(price),
-            "ORD_SVR_DVSN_CD": "0",
-            "ORD_DVSN": "00"
         }
         
-        # 초당 거래건수 제한 준수를 위한 재시도 로직
-        max_retries = 3
-        for attempt in range(max_retries):
+        try:
+            response = KisHttp.post_with_retry(url, headers, body, timeout=ORDER_REQUEST_TIMEOUT, retries=MAX_ORDER_RETRIES, log_tag="Overseas Order")
+            cls._record_order_result(response)
+            if KisHttp.is_rate_limited(response, idempotent=False):
+                logger.error(f"❌ Overseas Order failed after {MAX_ORDER_RETRIES} retries")
+                return {"status": "error", "msg": f"Failed after {MAX_ORDER_RETRIES} retries due to rate limit"}
+            data = cls._parse_order_body(response)
+            if response.status_code >= 400:
+                logger.error(f"❌ Error sending overseas order: HTTP {response.status_code} | Body: {response.text}")
+                return {"status": "error", "msg": data.get("msg1") or f"HTTP {response.status_code}"}
+            if data.get("rt_cd") != "0":
+                msg = data.get("msg1") or data.get("msg_cd") or "unknown"
+                logger.error(f"❌ Overseas Order failed: {msg}")
+                return {"status": "failed", "msg": msg}
+
+            logger.info(f"✅ Overseas Order Success! [{order_type.upper()}] {ticker} {quantity}qty @ ${price}")
+            return {"status": "success", "data": data.get('output', {})}
+        except requests.exceptions.Timeout as e:
+            cls._order_breaker.record_failure()
+            logger.error(f"⏱️ Overseas Order timed out: {e}")
+            return {"status": "timeout", "msg": "주문 응답 시간 초과 (체결 여부 확인 필요)"}
+        except Exception as e:
+            cls._order_breaker.record_failure()
+            logger.error(f"❌ Error sending overseas order: {e}")
+            return {"status": "error", "msg": str(e)}
+
+    @classmethod
+    def send_orders(cls, orders: list, max_wait_sec: Optional[float] = None) -> list:
+        """
+        여러 주문을 동시에 전송
+        - orders: [(ticker, quantity, price, order_type[, market]), ...] (국내/해외는 티커로 구분, 해외 market 기본 NASD)
+        - 반환: 입력 순서와 같은 결과 목록. max_wait_sec 안에 끝나지 않은 주문 중
+          아직 전송 전이던 주문은 취소되어 status="cancelled", 이미 전송 중이던 주문은 status="timeout"
+        """
+        def _dispatch(order: tuple) -> dict:
+            ticker, quantity, price, order_type, *rest = order
+            if is_kr(ticker):
+                return cls.send_order(ticker, quantity, price, order_type)
+            return cls.send_overseas_order(ticker, quantity, price, order_type, market=rest[0] if rest else "NASD")
+
+        futures = [_order_pool.submit(_dispatch, order) for order in orders]
+        _, not_done = wait(futures, timeout=max_wait_sec)
+        # 풀 대기열에 남아 있는 주문은 나중에 KIS로 나가지 않도록 취소 (timeout 재시도 시 중복 주문 방지)
+        cancelled = {future for future in not_done if future.cancel()}
+        results = []
+        for order, future in zip(orders, futures):
+            if future in cancelled:
+                logger.warning(f"🚫 Batch order cancelled before sending after {max_wait_sec}s: {order[0]}")
+                results.append({"status": "cancelled", "msg": "일괄 주문 대기 시간 초과로 전송 전 취소됨"})
+                continue
+            if not future.done():
+                logger.warning(f"⏱️ Batch order still pending after {max_wait_sec}s: {order[0]}")
+                results.append({"status": "timeout", "msg": "일괄 주문 대기 시간 초과 (주문 진행 중일 수 있음)"})
+                continue
             try:
-                # Throttle 적용
-                cls._throttle_request()
-                
-                response = requests.post(url, headers=headers, data=json.dumps(body), timeout=ORDER_REQUEST_TIMEOUT)
-                if cls._is_rate_limited_response(response):
-                    wait_sec = 1.2 * (attempt + 1)
-                    logger.warning(f"⏳ Overseas Order TPS limit hit. retry {attempt + 1}/{max_retries} in {wait_sec:.1f}s...")
-                    time.sleep(wait_sec)
-                    continue
-                response.raise_for_status()
-                data = response.json()
-                if data["rt_cd"] != "0":
-                    if data.get("msg_cd") == KIS_RATE_LIMIT_MSG_CD and attempt < max_retries - 1:
-                        wait_sec = 1.2 * (attempt + 1)
-                        logger.warning(f"⏳ Overseas Order TPS limit (rt_cd). retry {attempt + 1}/{max_retries} in {wait_sec:.1f}s...")
-                        time.sleep(wait_sec)
-                        continue
-                    logger.error(f"❌ Overseas Order failed: {data['msg1']}")
-                    return {"status": "failed", "msg": data['msg1']}
-                    
-                logger.info(f"✅ Overseas Order Success! [{order_type.upper()}] {ticker} {quantity}qty @ ${price}")
-                return {"status": "success", "data": data['output']}
-            except requests.exceptions.HTTPError as e:
-                error_msg = str(e)
-                try:
-                    # 초당 거래건수 에러인 경우 재시도
-                    if hasattr(e, 'response') and cls._is_rate_limited_response(e.response) and attempt < max_retries - 1:
-                        wait_sec = 1.2 * (attempt + 1)
-                        logger.warning(f"⏳ Overseas Order TPS limit (HTTP). retry {attempt + 1}/{max_retries} in {wait_sec:.1f}s...")
-                        time.sleep(wait_sec)
-                        continue
-                    logger.error(f"❌ Error sending overseas order: {error_msg}")
-                except:
-                    logger.error(f"❌ Error sending overseas order: {error_msg}")
-                return {"status": "error", "msg": error_msg}
+                results.append(future.result())
             except Exception as e:
-                logger.error(f"❌ Error sending overseas order: {e}")
-                return {"status": "error", "msg": str(e)}
-        
-        # 모든 재시도 실패
-        logger.error(f"❌ Overseas Order failed after {max_retries} retries")
-        return {"status": "error", "msg": f"Failed after {max_retries} retries due to rate limit"}
+                logger.error(f"❌ Error sending batch order {order[0]}: {e}")
+                results.append({"status": "error", "msg": str(e)})
+        return results
+
+    @classmethod
+    async def send_order_async(cls, ticker: str, quantity: int, price: int = 0, order_type: str = "buy") -> dict:
+        """send_order 비동기 버전 (단건용 풀에서 실행해 이벤트 루프와 일괄 주문 대기열을 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_interactive_pool, partial(cls.send_order, ticker, quantity, price, order_type))
+
+    @classmethod
+    async def send_overseas_order_async(cls, ticker: str, quantity: int, price: float = 0, order_type: str = "buy", market: str = "NASD") -> dict:
+        """send_overseas_order 비동기 버전 (단건용 풀에서 실행해 이벤트 루프와 일괄 주문 대기열을 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _interactive_pool, partial(cls.send_overseas_order, ticker, quantity, price, order_type, market=market)
+        )
+
+    @classmethod
+    async def get_balance_async(cls) -> Optional[dict]:
+        """get_balance 비동기 버전 (단건용 풀에서 실행해 이벤트 루프와 일괄 주문 대기열을 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_interactive_pool, cls.get_balance)
+
+    @classmethod
+    async def get_overseas_balance_async(cls) -> Optional[dict]:
+        """get_overseas_balance 비동기 버전"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_interactive_pool, cls.get_overseas_balance)
+
+    @classmethod
+    async def get_overseas_available_cash_async(cls) -> Optional[float]:
+        """get_overseas_available_cash 비동기 버전"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_interactive_pool, cls.get_overseas_available_cash)
+
+    @classmethod
+    def get_all_balances(cls) -> tuple:
+        """
+        국내/해외 잔고를 동시에 조회 (순차 호출 시 두 응답 대기 시간의 합 → 둘 중 긴 쪽)
+        - 반환: (국내 잔고, 해외 잔고). 실제 송신 간격은 KisHttp 토큰 버킷이 계속 제한
+        """
+        overseas_future = _interactive_pool.submit(cls.get_overseas_balance)
+        domestic = cls.get_balance()
+        try:
+            overseas = overseas_future.result()
+        except Exception as e:
+            logger.error(f"❌ Error fetching overseas balance: {e}")
+            overseas = None
+        return domestic, overseas
 
     # --- 확장된 메서드 (Modular 통합용) ---
     @classmethod
     def get_financials(cls, ticker: str, meta: Optional[dict] = None) -> dict:
         """국내 주식 재무/기본 지표 조회 (KisFetcher 활용). meta는 dict 또는 KisFinancialsMeta DTO."""
-        from services.kis.fetch.kis_fetcher import KisFetcher
         token = cls.get_access_token()
         meta_dict = meta.model_dump() if (meta is not None and hasattr(meta, "model_dump")) else meta
         return KisFetcher.fetch_domestic_price(token, ticker, meta=meta_dict)
@@ -510,13 +791,19 @@ class KisService:
     @classmethod
     def get_overseas_financials(cls, ticker: str, market: str = "NASD", meta: Optional[dict] = None) -> dict:
         """해외 주식 재무/기본 지표 조회 (KisFetcher 활용). meta는 dict 또는 KisFinancialsMeta DTO."""
-        from services.kis.fetch.kis_fetcher import KisFetcher
         token = cls.get_access_token()
         meta_dict = meta.model_dump() if (meta is not None and hasattr(meta, "model_dump")) else meta
         return KisFetcher.fetch_overseas_price(token, ticker, meta=meta_dict)
+
     @classmethod
     def get_overseas_ranking(cls, excd: str = "NAS") -> dict:
         """해외 주식 시가총액 순위 조회 (KisFetcher 활용)"""
-        from services.kis.fetch.kis_fetcher import KisFetcher
         token = cls.get_access_token()
         return KisFetcher.fetch_overseas_ranking(token, excd=excd)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """시세/재무/순위 조회 및 TR ID 캐시 비우기 (강제 새로고침/메타 변경 반영용). 잔고/주문은 캐시하지 않음"""
+        from services.market.stock_meta_service import StockMetaService
+        StockMetaService.clear_api_info_cache()
+        KisFetcher.clear_cache()
@@ -1,11 +1,13 @@
 import websockets
 import asyncio
-import json
+import time
 import logging
+import operator
 import os
-import requests
 from config import Config
+from services.kis.kis_http import KisHttp
 from services.market.market_data_service import MarketDataService
+from utils import fast_json
 from utils.logger import get_logger
 from utils.market import is_kr
 
@@ -15,6 +17,21 @@ logger = get_logger("kis_ws_service")
 WS_RETRY_DELAY_INITIAL = 5
 WS_RETRY_DELAY_MAX = 60
 WS_APPROVAL_REQUEST_TIMEOUT = 5
+WS_APPROVAL_URL = f"{Config.KIS_BASE_URL}/oauth2/Approval"
+# 접속키 유효기간은 24시간 → 여유를 두고 재발급
+WS_APPROVAL_KEY_TTL_SEC = 23 * 60 * 60
+# 서버가 이 코드(정책 위반/서버 오류)로 연결을 닫으면 접속키 문제일 수 있으므로 재발급
+WS_KEY_RESET_CLOSE_CODES = (1008, 1011)
+# 처리 대상 프레임 첫 글자: 체결 데이터('0' 평문 / '1' 암호화) 및 JSON 제어 메시지('{')
+_WS_ACCEPTED_HEAD_BYTES = (b"0", b"1", b"{")
+# 재연결 시 재구독 간격 (모의투자 2TPS 한도 기준 여유분 포함)
+WS_RESUBSCRIBE_INTERVAL_SEC = 0.55
+# 체결 데이터('^' 구분) 필드 위치: (현재가, 등락률, 시가, 고가, 저가, 누적거래량).
+# MIN_LEN은 분할 상한으로도 사용해 사용하지 않는 뒤쪽 필드는 하나의 문자열로 남김
+_DOMESTIC_TICK_FIELDS = operator.itemgetter(2, 5, 10, 11, 12, 13)
+_DOMESTIC_TICK_MIN_LEN = 14
+_OVERSEAS_TICK_FIELDS = operator.itemgetter(2, 5, 7, 8, 9, 6)
+_OVERSEAS_TICK_MIN_LEN = 10
 
 
 class KisWsService:
@@ -25,15 +42,28 @@ class KisWsService:
     """
     
     def __init__(self):
-        self.ws_url = Config.KIS_WS_URL
+        self.ws_url = self._resolve_ws_url(Config.KIS_WS_URL)
         self.approval_key = None
+        self.approval_key_deadline = 0.0  # time.monotonic() 기준
         self.connected = False
         self.subscribed_tickers = set()
         self.subscribed_markets = {}
+        # {ticker: 최신 체결 데이터} — 소비 태스크가 가져가기 전의 중간 틱은 최신 값으로 덮어씀
+        self._pending_ticks = {}
+        self._tick_event = asyncio.Event()
+        self._tick_task = None
         
+    @staticmethod
+    def _resolve_ws_url(ws_url: str) -> str:
+        """모의투자(VTS)의 경우 포트 조정 (21000 -> 31000). 설정값은 프로세스 수명 동안 고정이므로 생성 시 1회만 계산"""
+        if "vts" in (Config.KIS_BASE_URL or "").lower() and ":21000" in ws_url:
+            ws_url = ws_url.replace(":21000", ":31000")
+            logger.info(f"🔌 VTS Environment detected. Using port 31000: {ws_url}")
+        return ws_url
+
     def get_approval_key(self):
         """웹소켓 접속키 발급"""
-        url = f"{Config.KIS_BASE_URL}/oauth2/Approval"
+        url = WS_APPROVAL_URL
         headers = {"content-type": "application/json; charset=utf-8"}
         body = {
             "grant_type": "client_credentials",
@@ -42,9 +72,10 @@ class KisWsService:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=body, timeout=WS_APPROVAL_REQUEST_TIMEOUT)
+            response = KisHttp.session().post(url, headers=headers, data=fast_json.dumps_bytes(body), timeout=WS_APPROVAL_REQUEST_TIMEOUT)
             if response.status_code == 200:
-                self.approval_key = response.json().get("approval_key")
+                self.approval_key = fast_json.loads(response.content).get("approval_key")
+                self.approval_key_deadline = time.monotonic() + WS_APPROVAL_KEY_TTL_SEC
                 logger.info("🔑 WebSocket Approval Key acquired.")
                 return True
             logger.error(f"❌ Failed to get approval key: {response.text}")
@@ -55,20 +86,18 @@ class KisWsService:
 
     async def connect(self):
         """웹소켓 연결 및 자동 재연결 루프"""
+        if self._tick_task is None or self._tick_task.done():
+            self._tick_task = asyncio.create_task(self._consume_ticks())
         retry_delay = 5
         while True:
             try:
-                if not self.approval_key:
-                    if not self.get_approval_key():
+                if not self.approval_key or time.monotonic() >= self.approval_key_deadline:
+                    # 동기 HTTP 호출이므로 스레드에서 실행해 이벤트 루프를 막지 않음
+                    if not await asyncio.to_thread(self.get_approval_key):
                         await asyncio.sleep(retry_delay)
                         continue
 
-                # 모의투자(VTS)의 경우 포트 조정 (21000 -> 31000)
                 ws_url = self.ws_url
-                if "vts" in Config.KIS_BASE_URL.lower() and ":21000" in ws_url:
-                    ws_url = ws_url.replace(":21000", ":31000")
-                    logger.info(f"🔌 VTS Environment detected. Using port 31000: {ws_url}")
-
                 logger.info(f"🌐 Connecting to WebSocket: {ws_url} (Timeout: 60s)")
                 
                 async with websockets.connect(
@@ -85,21 +114,17 @@ class KisWsService:
                     
                     # 기존 구독 티커 재요구
                     if self.subscribed_tickers:
-                        logger.info(f"🔄 Re-subscribing to {len(self.subscribed_tickers)} tickers...")
-                        saved_items = [(t, self.subscribed_markets.get(t)) for t in self.subscribed_tickers]
-                        self.subscribed_tickers.clear()
-                        for ticker, market in saved_items:
-                            if not market:
-                                market = "KRX" if is_kr(ticker) else "NAS"
-                            await self.subscribe(ticker, market=market)
-                            await asyncio.sleep(1.0) # 재구독 속도 조절 (TPS 준수)
+                        await self.resubscribe_all()
 
                     while True:
                         try:
                             msg = await websocket.recv()
                             await self.handle_message(msg)
-                        except websockets.ConnectionClosed:
-                            logger.warning("📡 WebSocket Connection Closed by Server.")
+                        except websockets.ConnectionClosed as e:
+                            close_code = getattr(getattr(e, "rcvd", None), "code", None)
+                            logger.warning(f"📡 WebSocket Connection Closed by Server. (code={close_code})")
+                            if close_code in WS_KEY_RESET_CLOSE_CODES:
+                                self.approval_key = None
                             break
                         except Exception as e:
                             logger.error(f"Error receiving message: {e}")
@@ -114,28 +139,35 @@ class KisWsService:
             # 지수 백오프 적용 (최대 60초)
             retry_delay = min(retry_delay * 2, 60)
 
-    async def subscribe(self, ticker: str, market: str = "KRX"):
-        """종목 실시간 체결가 구독"""
-        MarketDataService.register_ticker(ticker)
-        market = (market or "KRX").upper()
-        
-        if not self.connected or not self.websocket:
-            self.subscribed_tickers.add(ticker)
-            self.subscribed_markets[ticker] = market
-            logger.info(f"🕒 {ticker} added to subscription queue (Waiting for connection...)")
-            return
+    async def resubscribe_all(self):
+        """재연결 후 기존 구독 종목을 일정 간격으로 다시 구독.
+        전송 시간만큼 대기를 줄이도록 i번째 구독을 시작 시각 + i * 간격에 맞춰 보냅니다.
+        """
+        logger.info(f"🔄 Re-subscribing to {len(self.subscribed_tickers)} tickers...")
+        saved_items = [
+            (t, self.subscribed_markets.get(t) or ("KRX" if is_kr(t) else "NAS"))
+            for t in self.subscribed_tickers
+        ]
+        # 전송 루프에서는 대기와 send만 수행하도록 구독 프레임을 미리 직렬화
+        frames = [self._subscribe_frame(t, m) for t, m in saved_items]
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for i, frame in enumerate(frames):
+            if i:
+                await asyncio.sleep(max(0.0, started + i * WS_RESUBSCRIBE_INTERVAL_SEC - loop.time()))
+            await self.websocket.send(frame)
+        self.subscribed_markets.update(saved_items)
+        logger.info(f"➕ Re-subscribed to {len(frames)} tickers")
 
-        if ticker in self.subscribed_tickers:
-            pass
-            
+    def _subscribe_frame(self, ticker: str, market: str) -> str:
+        """실시간 체결가 구독 요청 프레임(JSON 문자열) 생성"""
         if market == "KRX":
             tr_id = "H0STCNT0"
             tr_key = ticker
         else:
             tr_id = "HDFSUSP0"
             tr_key = f"D{market}{ticker}"
-            
-        body = {
+        return fast_json.dumps({
             "header": {
                 "approval_key": self.approval_key,
                 "custtype": "P",
@@ -148,19 +180,41 @@ class KisWsService:
                     "tr_key": tr_key
                 }
             }
-        }
-        await self.websocket.send(json.dumps(body))
+        })
+
+    async def subscribe(self, ticker: str, market: str = "KRX"):
+        """종목 실시간 체결가 구독"""
+        MarketDataService.register_ticker(ticker)
+        market = (market or "KRX").upper()
+        
+        if not self.connected or not self.websocket:
+            self.subscribed_tickers.add(ticker)
+            self.subscribed_markets[ticker] = market
+            logger.info(f"🕒 {ticker} added to subscription queue (Waiting for connection...)")
+            return
+
+        await self.websocket.send(self._subscribe_frame(ticker, market))
         self.subscribed_tickers.add(ticker)
         self.subscribed_markets[ticker] = market
         logger.info(f"➕ Subscribed to {ticker} ({market})")
 
     async def handle_message(self, msg):
         """수신 메시지 처리 및 파싱"""
-        if msg[0] not in ('0', '1'):
+        if isinstance(msg, bytes):
+            # 바이너리 프레임은 첫 바이트로 먼저 거르고 필요한 경우에만 디코딩
+            if msg[:1] not in _WS_ACCEPTED_HEAD_BYTES:
+                return
+            msg = msg.decode("utf-8", "replace")
+        head = msg[:1]
+        if head == '{':
+            self.handle_control_message(msg)
+            return
+        if head != '0' and head != '1':
             return
 
         try:
-            parts = msg.split('|')
+            # 헤더 3개만 분리하고 체결 데이터 본문은 그대로 유지
+            parts = msg.split('|', 3)
             if len(parts) < 4: return
             
             tr_id = parts[1]
@@ -172,41 +226,68 @@ class KisWsService:
                 if is_kr(ticker) and len(ticker) == 6:
                     self.parse_realtime_price(ticker, data_str)
             elif tr_id == "HDFSUSP0":
-                values = data_str.split('^')
-                ticker = values[0]
+                ticker = data_str.partition('^')[0]
                 self.parse_overseas_realtime_price(ticker, data_str)
                 
         except Exception as e:
             logger.error(f"Error handling message: {e}")
 
+    def handle_control_message(self, msg: str):
+        """JSON 제어 메시지 처리 (구독 응답 등). 접속키 오류면 다음 재연결 시 재발급"""
+        try:
+            body = fast_json.loads(msg).get("body") or {}
+        except (ValueError, AttributeError):
+            return
+        if body.get("rt_cd") not in (None, "0") and "approval" in (body.get("msg1") or "").lower():
+            logger.warning(f"🔑 WebSocket approval key rejected: {body.get('msg1')}. Will re-issue on reconnect.")
+            self.approval_key = None
+
+    def _push_tick(self, ticker: str, parsed_data: dict):
+        """체결 데이터를 종목별 최신 값으로 모아 두고 소비 태스크를 깨움 (수신 루프는 상태 갱신을 기다리지 않음)"""
+        self._pending_ticks[ticker] = parsed_data
+        self._tick_event.set()
+
+    async def _consume_ticks(self):
+        """모인 체결 데이터를 MarketDataService로 일괄 전달 (종목 수만큼만 쌓이므로 별도 상한 불필요)"""
+        while True:
+            await self._tick_event.wait()
+            self._tick_event.clear()
+            ticks, self._pending_ticks = self._pending_ticks, {}
+            try:
+                MarketDataService.on_realtime_data_batch(ticks)
+            except Exception as e:
+                logger.error(f"Error applying realtime ticks: {e}")
+
     def parse_overseas_realtime_price(self, ticker: str, data_str: str):
         """HDFSUSP0 데이터 파싱 (미국 주식)"""
-        values = data_str.split('^')
-        if len(values) < 10: return
-        
+        values = data_str.split('^', _OVERSEAS_TICK_MIN_LEN)
+        if len(values) < _OVERSEAS_TICK_MIN_LEN: return
+
+        price, rate, open_, high, low, volume = _OVERSEAS_TICK_FIELDS(values)
         parsed_data = {
-            "price": float(values[2]),
-            "rate": float(values[5]),
-            "open": float(values[7]) if len(values) > 7 else 0,
-            "high": float(values[8]) if len(values) > 8 else 0,
-            "low": float(values[9]) if len(values) > 9 else 0,
-            "volume": int(values[6]) if len(values) > 6 else 0
+            "price": float(price),
+            "rate": float(rate),
+            "open": float(open_),
+            "high": float(high),
+            "low": float(low),
+            "volume": int(volume)
         }
-        MarketDataService.on_realtime_data(ticker, parsed_data)
+        self._push_tick(ticker, parsed_data)
 
     def parse_realtime_price(self, ticker: str, data_str: str):
         """H0STCNT0 데이터 파싱 (국내 주식)"""
-        values = data_str.split('^')
-        if len(values) < 10: return
-        
+        values = data_str.split('^', _DOMESTIC_TICK_MIN_LEN)
+        if len(values) < _DOMESTIC_TICK_MIN_LEN: return
+
+        price, rate, open_, high, low, volume = _DOMESTIC_TICK_FIELDS(values)
         parsed_data = {
-            "price": float(values[2]),
-            "rate": float(values[5]),
-            "open": float(values[10]),
-            "high": float(values[11]),
-            "low": float(values[12]),
-            "volume": int(values[13])
+            "price": float(price),
+            "rate": float(rate),
+            "open": float(open_),
+            "high": float(high),
+            "low": float(low),
+            "volume": int(volume)
         }
-        MarketDataService.on_realtime_data(ticker, parsed_data)
+        self._push_tick(ticker, parsed_data)
 
 kis_ws_service = KisWsService()
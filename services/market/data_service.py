@@ -1,11 +1,18 @@
 import pandas as pd
 import numpy as np
-import time
+import heapq
+import re
 import requests
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
 from config import Config
 from utils.logger import get_logger
-from utils.market import is_kr
+from utils.market import history_route
 from services.kis.kis_service import KisService
 from services.kis.fetch.kis_fetcher import KisFetcher
 from services.market.stock_meta_service import StockMetaService
@@ -22,15 +29,74 @@ COL_HIGH = "High"
 COL_LOW = "Low"
 COL_OPEN = "Open"
 COL_DATE = "Date"
+COL_VOLUME = "Volume"
+PRICE_COLUMNS = (COL_CLOSE, COL_HIGH, COL_LOW, COL_OPEN)
+KIS_DATE_FORMAT = "%Y%m%d"
+# KIS 일봉 응답 필드 → 히스토리 컬럼명 (국내/지수 차트, 해외 clos 형식, 해외 last 형식)
+RENAME_MAP_KR = {"stck_clpr": COL_CLOSE, "stck_hgpr": COL_HIGH, "stck_lwpr": COL_LOW, "stck_oprc": COL_OPEN, "stck_bsop_date": COL_DATE}
+RENAME_MAP_US_CLOS = {"clos": COL_CLOSE, "high": COL_HIGH, "low": COL_LOW, "open": COL_OPEN, "xymd": COL_DATE}
+RENAME_MAP_US_LAST = {"last": COL_CLOSE, "high": COL_HIGH, "low": COL_LOW, "open": COL_OPEN, "xymd": COL_DATE}
+# 종가 필드명 → 매핑 (응답 형태 판별 순서)
+_HISTORY_RENAME_BY_CLOSE_KEY = (("stck_clpr", RENAME_MAP_KR), ("clos", RENAME_MAP_US_CLOS), ("last", RENAME_MAP_US_LAST))
 # KIS API 제한
-KIS_RATE_LIMIT_SLEEP_SEC = 0.5
+# 일일 동기화 동시 처리 종목 수 (KIS 요청 속도는 KisHttp 토큰 버킷이 전역으로 제한)
+SYNC_DAILY_WORKERS = 4
 KIS_HISTORY_BATCH_LIMIT = 100
 HISTORY_DAYS_DEFAULT = 365
+# 일봉 히스토리 캐시: 같은 날 (ticker, days) 반복 조회는 재요청 없이 재사용
+HISTORY_CACHE_TTL_SEC = 3600.0
+HISTORY_CACHE_MAX_ENTRIES = 1024
 # 국내 랭킹 실패 시 기본 종목
 KR_FALLBACK_TICKERS = ["005930", "000660", "373220", "207940", "005380", "005490", "035420", "000270", "051910", "105560"]
 KR_FALLBACK_MINIMAL = ["005930", "000660", "373220", "207940", "005380"]
+# 국내 단일종목 코드 형식 (6자리 숫자, SQLite GLOB 패턴)
+KR_STOCK_TICKER_GLOB = "[0-9]" * 6
 # FDR 지수 심볼 매핑
 FDR_INDEX_SYMBOL_MAP = {"SPX": "US500", "NAS": "IXIC", "DJI": "DJI", "VIX": "VIX"}
+# ETF/ETN/펀드성 상품 판별 키워드 (대문자 이름에 대한 부분 문자열 매칭)
+KR_FUND_NAME_KEYWORDS = (
+    "ETF", "ETN", "인버스", "레버리지", "TRF", "TDF",
+    "KODEX", "TIGER", "KINDEX", "KBSTAR", "ARIRANG",
+    "KOSEF", "HANARO", "SOL", "ACE", "RISE"
+)
+US_FUND_NAME_KEYWORDS = (
+    " ETF", " ETN", " FUND", " TRUST", " INDEX FUND",
+    " ULTRASHORT", " ULTRA ", " BULL ", " BEAR "
+)
+# 키워드 목록을 하나의 정규식으로 묶어 이름당 한 번만 스캔
+_KR_FUND_NAME_RE = re.compile("|".join(map(re.escape, KR_FUND_NAME_KEYWORDS)))
+_US_FUND_NAME_RE = re.compile("|".join(map(re.escape, US_FUND_NAME_KEYWORDS)))
+US_ETF_TICKERS = frozenset({
+    "SPY", "IVV", "VOO", "VTI", "QQQ", "QQQM", "DIA", "IWM", "EFA", "EEM",
+    "TLT", "IEF", "BND", "BNDX", "VCIT", "SMH", "VXUS", "IXUS", "IBIT"
+})
+# 미국 랭킹 조회 실패 시 대체 종목 (시가총액 상위 core → extended 순, NYSE 상장 종목은 별도 표기)
+US_FALLBACK_CORE = (
+    "AAPL", "NVDA", "MSFT", "AMZN", "GOOGL", "META", "TSLA", "AVGO", "COST", "NFLX",
+    "JPM", "V", "LLY", "XOM", "UNH"
+)
+US_FALLBACK_EXTENDED = (
+    "GOOG", "BRK", "WMT", "MA", "ORCL", "HD", "BAC", "PG", "JNJ", "ABBV",
+    "KO", "PEP", "MRK", "CVX", "AMD", "ADBE", "CRM", "CSCO", "INTC", "T",
+    "VZ", "PFE", "ABT", "CMCSA", "QCOM", "MCD", "NKE", "TXN", "DHR", "WFC",
+    "DIS", "AMGN", "UNP", "LOW", "NEE", "IBM", "PM", "RTX", "SPGI", "CAT",
+    "GS", "HON", "INTU", "BKNG", "BLK", "AXP", "PLD", "LMT", "TMO", "MDT",
+    "SYK", "DE", "TJX", "GILD", "ADP", "ISRG", "C", "SCHW", "MMC", "CB",
+    "ETN", "SO", "CI", "DUK", "PGR", "ELV", "ZTS", "BDX", "MU", "KLAC",
+    "SNPS", "PANW", "AMAT", "LRCX", "MELI", "SBUX", "REGN", "VRTX", "NOW", "UBER",
+    "SHOP", "CRWD", "DASH", "PYPL", "SQ", "TTD", "ROKU", "BIDU", "PDD", "NTES",
+    "ASML", "TMUS", "NDAQ", "EA", "ADSK", "ORLY", "MAR", "CEG", "FANG", "CSX",
+    "AEP", "MNST", "MRVL", "NXPI", "IDXX", "FTNT", "ABNB", "WBD", "CME", "PCAR",
+    "XEL", "MCHP", "CTAS", "FAST", "ARGX", "ALNY", "STX", "HOOD", "SNY", "ARM"
+)
+US_FALLBACK_NYSE_SYMBOLS = frozenset({
+    "JPM", "V", "LLY", "XOM", "UNH", "BRK", "WMT", "MA", "HD", "BAC", "PG", "JNJ",
+    "ABBV", "KO", "PEP", "MRK", "CVX", "T", "VZ", "PFE", "ABT", "MCD", "NKE", "DHR",
+    "WFC", "DIS", "AMGN", "UNP", "LOW", "NEE", "IBM", "PM", "RTX", "SPGI", "CAT",
+    "GS", "HON", "BLK", "AXP", "PLD", "LMT", "TMO", "MDT", "SYK", "DE", "TJX",
+    "GILD", "C", "SCHW", "MMC", "CB", "ETN", "SO", "CI", "DUK", "PGR", "ELV",
+    "ZTS", "BDX", "UBER", "TMUS", "NDAQ", "CME", "PCAR", "XEL", "CEG", "FANG", "CSX", "AEP"
+})
 
 
 class DataService:
@@ -38,82 +104,47 @@ class DataService:
         KIS API 기반 데이터 수집 및 지표 계산 서비스
         - 지수 데이터는 KIS 실패 시 FinanceDataReader로 보완합니다.
     """
+    # {(ticker, days, YYYYMMDD): (만료 시각(monotonic), DataFrame)}
+    _history_cache: OrderedDict = OrderedDict()
+    _history_cache_lock = threading.Lock()
 
     @classmethod
     def _is_fund_like_security(cls, ticker: str, name: str, market: str) -> bool:
         """ETF/ETN/펀드성 상품 여부 판별"""
-        t = str(ticker or "").strip().upper()
         n = str(name or "").strip().upper()
         m = str(market or "").strip().upper()
 
         if m == "KR":
-            kr_keywords = [
-                "ETF", "ETN", "인버스", "레버리지", "TRF", "TDF",
-                "KODEX", "TIGER", "KINDEX", "KBSTAR", "ARIRANG",
-                "KOSEF", "HANARO", "SOL", "ACE", "RISE"
-            ]
-            return any(k.upper() in n for k in kr_keywords)
+            return _KR_FUND_NAME_RE.search(n) is not None
 
         # US
-        us_name_keywords = [
-            " ETF", " ETN", " FUND", " TRUST", " INDEX FUND",
-            " ULTRASHORT", " ULTRA ", " BULL ", " BEAR "
-        ]
-        if any(k in n for k in us_name_keywords):
+        if _US_FUND_NAME_RE.search(n) is not None:
             return True
-
         # 이름이 비어있거나 불확실할 때를 대비해 대표 ETF 티커 블록리스트
-        us_etf_tickers = {
-            "SPY", "IVV", "VOO", "VTI", "QQQ", "QQQM", "DIA", "IWM", "EFA", "EEM",
-            "TLT", "IEF", "BND", "BNDX", "VCIT", "SMH", "VXUS", "IXUS", "IBIT"
-        }
-        return t in us_etf_tickers
+        return str(ticker or "").strip().upper() in US_ETF_TICKERS
 
     @classmethod
     def _build_us_fallback_data(cls, limit: int = 100) -> list:
         """미국 랭킹 조회 실패 시 사용할 대체 티커 목록(최대 limit)"""
-        core = [
-            "AAPL", "NVDA", "MSFT", "AMZN", "GOOGL", "META", "TSLA", "AVGO", "COST", "NFLX",
-            "JPM", "V", "LLY", "XOM", "UNH"
-        ]
-        extended = [
-            "GOOG", "BRK", "WMT", "MA", "ORCL", "HD", "BAC", "PG", "JNJ", "ABBV",
-            "KO", "PEP", "MRK", "CVX", "AMD", "ADBE", "CRM", "CSCO", "INTC", "T",
-            "VZ", "PFE", "ABT", "CMCSA", "QCOM", "MCD", "NKE", "TXN", "DHR", "WFC",
-            "DIS", "AMGN", "UNP", "LOW", "NEE", "IBM", "PM", "RTX", "SPGI", "CAT",
-            "GS", "HON", "INTU", "BKNG", "BLK", "AXP", "PLD", "LMT", "TMO", "MDT",
-            "SYK", "DE", "TJX", "GILD", "ADP", "ISRG", "C", "SCHW", "MMC", "CB",
-            "ETN", "SO", "CI", "DUK", "PGR", "ELV", "ZTS", "BDX", "MU", "KLAC",
-            "SNPS", "PANW", "AMAT", "LRCX", "MELI", "SBUX", "REGN", "VRTX", "NOW", "UBER",
-            "SHOP", "CRWD", "DASH", "PYPL", "SQ", "TTD", "ROKU", "BIDU", "PDD", "NTES",
-            "ASML", "TMUS", "NDAQ", "EA", "ADSK", "ORLY", "MAR", "CEG", "FANG", "CSX",
-            "AEP", "MNST", "MRVL", "NXPI", "IDXX", "FTNT", "ABNB", "WBD", "CME", "PCAR",
-            "XEL", "MCHP", "CTAS", "FAST", "ARGX", "ALNY", "STX", "HOOD", "SNY", "ARM"
-        ]
-        nyse_symbols = {
-            "JPM", "V", "LLY", "XOM", "UNH", "BRK", "WMT", "MA", "HD", "BAC", "PG", "JNJ",
-            "ABBV", "KO", "PEP", "MRK", "CVX", "T", "VZ", "PFE", "ABT", "MCD", "NKE", "DHR",
-            "WFC", "DIS", "AMGN", "UNP", "LOW", "NEE", "IBM", "PM", "RTX", "SPGI", "CAT",
-            "GS", "HON", "BLK", "AXP", "PLD", "LMT", "TMO", "MDT", "SYK", "DE", "TJX",
-            "GILD", "C", "SCHW", "MMC", "CB", "ETN", "SO", "CI", "DUK", "PGR", "ELV",
-            "ZTS", "BDX", "UBER", "TMUS", "NDAQ", "CME", "PCAR", "XEL", "CEG", "FANG", "CSX", "AEP"
-        }
+        return list(cls._us_fallback_universe()[:limit])
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _us_fallback_universe() -> tuple:
+        """대체 티커 전체 목록 ((ticker, excd, 거래소명), ...) — 상수에서 파생되므로 1회만 계산"""
         ordered = []
         seen = set()
-        for sym_candidate in core + extended:
+        for sym_candidate in US_FALLBACK_CORE + US_FALLBACK_EXTENDED:
             sym = str(sym_candidate).strip().upper()
             if not sym or sym in seen:
                 continue
             seen.add(sym)
-            excd = "NYS" if sym in nyse_symbols else "NAS"
+            excd = "NYS" if sym in US_FALLBACK_NYSE_SYMBOLS else "NAS"
             ex_name = "NYSE" if excd == "NYS" else "NASD"
-            if cls._is_fund_like_security(sym, sym, "US"):
+            if DataService._is_fund_like_security(sym, sym, "US"):
                 continue
             ordered.append((sym, excd, ex_name))
-            if len(ordered) >= limit:
-                break
-        return ordered
+        return tuple(ordered)
 
     @classmethod
     def get_top_krx_tickers(cls, limit: int = 100) -> list:
@@ -124,22 +155,24 @@ class DataService:
             tickers = []
             if response.get("output"):
                 tr_id, path = StockMetaService.get_api_info("주식현재가_시세")
+                meta_rows = []
                 for item in response["output"]:
                     ticker = item.get("mksc_shrn_iscd")
                     name = item.get("hts_kor_isnm")
                     if ticker and (not cls._is_fund_like_security(ticker, name, "KR")):
                         tickers.append(ticker)
-                        StockMetaService.upsert_stock_meta(
-                            ticker=ticker,
-                            name_ko=name,
-                            market_type="KR",
-                            exchange_code="KRX",
-                            api_path=path,
-                            api_tr_id=tr_id,
-                            api_market_code="J"
-                        )
+                        meta_rows.append({
+                            "ticker": ticker,
+                            "name_ko": name,
+                            "market_type": "KR",
+                            "exchange_code": "KRX",
+                            "api_path": path,
+                            "api_tr_id": tr_id,
+                            "api_market_code": "J",
+                        })
                         if len(tickers) >= limit:
                             break
+                StockMetaService.bulk_upsert_stock_meta(meta_rows)
             if not tickers:
                 tickers = list(KR_FALLBACK_TICKERS)
                 logger.info(f"⚠️ KRX ranking empty. Using fallback list: {len(tickers)} tickers.")
@@ -150,16 +183,13 @@ class DataService:
                     from models.stock_meta import StockMeta
                     session = StockMetaService.get_session()
                     existing = set(tickers)
+                    # 6자리 숫자 종목코드만 DB에서 거르고, 필요한 두 컬럼만 조회 (ORM 객체 생성 생략)
                     query = (
-                        session.query(StockMeta)
+                        session.query(StockMeta.ticker, StockMeta.name_ko)
                         .filter(StockMeta.market_type == "KR")
-                        .all()
+                        .filter(StockMeta.ticker.op("GLOB")(KR_STOCK_TICKER_GLOB))
                     )
-                    for row in query:
-                        meta_ticker = str(getattr(row, "ticker", "") or "").strip()
-                        name_ko = str(getattr(row, "name_ko", "") or "").strip()
-                        if not (meta_ticker.isdigit() and len(meta_ticker) == 6):
-                            continue
+                    for meta_ticker, name_ko in query:
                         if meta_ticker in existing:
                             continue
                         if cls._is_fund_like_security(meta_ticker, name_ko, "KR"):
@@ -175,6 +205,19 @@ class DataService:
             logger.error(f"Error fetching top KRX tickers via KIS: {e}")
             return list(KR_FALLBACK_MINIMAL)
 
+    @staticmethod
+    def _us_fallback_meta_row(ticker: str, excd: str, exchange_code: str, path: str, tr_id: str) -> dict:
+        """대체 목록 미국 종목의 메타 저장용 row"""
+        return {
+            "ticker": ticker,
+            "name_ko": ticker,
+            "market_type": "US",
+            "exchange_code": exchange_code,
+            "api_path": path,
+            "api_tr_id": tr_id,
+            "api_market_code": excd,
+        }
+
     @classmethod
     def get_top_us_tickers(cls, limit: int = 100) -> list:
         """KIS API를 통해 미국 주식 시가총액 상위 종목을 수집합니다."""
@@ -182,39 +225,36 @@ class DataService:
             token = KisService.get_access_token()
             response_nas = KisFetcher.fetch_overseas_ranking(token, excd="NAS")
             response_nys = KisFetcher.fetch_overseas_ranking(token, excd="NYS")
-            combined = []
-            for response, excd in [(response_nas, "NAS"), (response_nys, "NYS")]:
-                if response.get("output"):
-                    for item in response["output"]:
-                        ticker = item.get('symb')
-                        name = item.get('hname')
-                        if cls._is_fund_like_security(ticker, name, "US"):
-                            continue
-                        combined.append({
-                            "ticker": ticker,
-                            "name": name,
-                            "excd": excd,
-                            "mcap": float(item.get('mcap', 0))
-                        })
-            
-            # 시총 순 정렬
-            combined.sort(key=lambda x: x['mcap'], reverse=True)
-            
+            candidates = (
+                {
+                    "ticker": item.get('symb'),
+                    "name": item.get('hname'),
+                    "excd": excd,
+                    "mcap": float(item.get('mcap', 0))
+                }
+                for response, excd in [(response_nas, "NAS"), (response_nys, "NYS")]
+                for item in (response.get("output") or [])
+                if not cls._is_fund_like_security(item.get('symb'), item.get('hname'), "US")
+            )
+            # 시총 상위 limit개만 선택 (전체 정렬 없이)
+            top = heapq.nlargest(limit, candidates, key=lambda x: x['mcap'])
+
             tickers = []
+            meta_rows = []
             tr_id, path = StockMetaService.get_api_info("해외주식_상세시세")
-            for item in combined[:limit]:
+            for item in top:
                 ticker = item['ticker']
                 if ticker:
                     tickers.append(ticker)
-                    StockMetaService.upsert_stock_meta(
-                        ticker=ticker,
-                        name_ko=item['name'],
-                        market_type="US",
-                        exchange_code="NASD" if item['excd'] == "NAS" else "NYSE",
-                        api_path=path,
-                        api_tr_id=tr_id,
-                        api_market_code=item['excd']
-                    )
+                    meta_rows.append({
+                        "ticker": ticker,
+                        "name_ko": item['name'],
+                        "market_type": "US",
+                        "exchange_code": "NASD" if item['excd'] == "NAS" else "NYSE",
+                        "api_path": path,
+                        "api_tr_id": tr_id,
+                        "api_market_code": item['excd'],
+                    })
             if len(tickers) < limit:
                 existing = set(tickers)
                 for fallback_ticker, excd, ex_name in cls._build_us_fallback_data(limit=limit * 2):
@@ -224,32 +264,16 @@ class DataService:
                         continue
                     existing.add(fallback_ticker)
                     tickers.append(fallback_ticker)
-                    StockMetaService.upsert_stock_meta(
-                        ticker=fallback_ticker,
-                        name_ko=fallback_ticker,
-                        market_type="US",
-                        exchange_code=ex_name,
-                        api_path=path,
-                        api_tr_id=tr_id,
-                        api_market_code=excd
-                    )
+                    meta_rows.append(cls._us_fallback_meta_row(fallback_ticker, excd, ex_name, path, tr_id))
 
             if not tickers:
                 fallback_data = cls._build_us_fallback_data(limit=limit)
                 tickers = []
-                tr_id, path = StockMetaService.get_api_info("해외주식_상세시세")
                 for fallback_ticker, excd, ex_name in fallback_data:
                     tickers.append(fallback_ticker)
-                    StockMetaService.upsert_stock_meta(
-                        ticker=fallback_ticker,
-                        name_ko=fallback_ticker,
-                        market_type="US",
-                        exchange_code=ex_name,
-                        api_path=path,
-                        api_tr_id=tr_id,
-                        api_market_code=excd
-                    )
+                    meta_rows.append(cls._us_fallback_meta_row(fallback_ticker, excd, ex_name, path, tr_id))
                 logger.info(f"⚠️ US ranking empty. Using fallback list: {len(tickers)} tickers with metadata.")
+            StockMetaService.bulk_upsert_stock_meta(meta_rows)
             return tickers
         except Exception as e:
             logger.error(f"Error fetching top US tickers via KIS: {e}")
@@ -257,91 +281,164 @@ class DataService:
 
     @classmethod
     def get_price_history(cls, ticker: str, days: int = 300) -> pd.DataFrame:
-        """KIS API를 통해 과거 N일간의 가격 데이터를 가져옵니다."""
+        """KIS API를 통해 과거 N일간의 가격 데이터를 가져옵니다.
+        같은 날 같은 (ticker, days) 요청은 HISTORY_CACHE_TTL_SEC 동안 캐시된 결과의 복사본을 반환합니다.
+        """
+        key = (ticker, days, datetime.now().strftime(KIS_DATE_FORMAT))
+        with cls._history_cache_lock:
+            entry = cls._history_cache.get(key)
+            if entry and time.monotonic() < entry[0]:
+                cls._history_cache.move_to_end(key)
+                # 호출 측에서 컬럼 추가 등으로 수정해도 캐시 원본이 바뀌지 않도록 복사
+                return entry[1].copy()
+        df = cls._load_price_history(ticker, days)
+        # 빈 결과(일시 오류 포함)는 캐시하지 않아 다음 호출에서 다시 시도
+        if not df.empty:
+            with cls._history_cache_lock:
+                cls._history_cache[key] = (time.monotonic() + HISTORY_CACHE_TTL_SEC, df.copy())
+                cls._history_cache.move_to_end(key)
+                while len(cls._history_cache) > HISTORY_CACHE_MAX_ENTRIES:
+                    cls._history_cache.popitem(last=False)
+        return df
+
+    @classmethod
+    def clear_history_cache(cls) -> None:
+        """일봉 히스토리 캐시 비우기 (강제 새로고침용)"""
+        with cls._history_cache_lock:
+            cls._history_cache.clear()
+
+    @classmethod
+    def _load_price_history(cls, ticker: str, days: int) -> pd.DataFrame:
+        """get_price_history의 실제 조회 (캐시 미사용)"""
         # 기존에 fetch_daily_price, fetch_overseas_daily_price를 이미 구현/정리했음을 가정
-        from services.kis.fetch.kis_fetcher import KisFetcher
         # 과거 시세 조회는 시장 운영 시간과 무관하게 허용됨 (MarketHourService.can_fetch_history() 반영)
-        is_kr_ticker = is_kr(ticker)
+        route = history_route(ticker)
 
         logger.info(f"💾 Fetching history for {ticker} (Last {days} days)...")
 
         try:
             token = KisService.get_access_token()
-            from datetime import timedelta
             end_date = datetime.now().strftime("%Y%m%d")
             start_date = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
-            
-            if is_kr_ticker:
-                response = KisFetcher.fetch_daily_price(token, ticker, start_date, end_date)
-                if not response or not response.get("output2"):
+            paginate = days > 150
+
+            # 페이지는 원본(배열/행 목록) 단계에서 이어 붙이고 DataFrame은 마지막에 한 번만 생성
+            if route == "KR":
+                columns = KisFetcher.fetch_daily_price_arrays(token, ticker, start_date, end_date)
+                if not columns:
                     return pd.DataFrame()
-                df = pd.DataFrame(response["output2"])
-                df = df.rename(columns={"stck_clpr": COL_CLOSE, "stck_hgpr": COL_HIGH, "stck_lwpr": COL_LOW, "stck_oprc": COL_OPEN, "stck_bsop_date": COL_DATE})
-            elif ticker in ["SPX", "NAS", "VIX", "DJI"]:
-                response = KisFetcher.fetch_overseas_daily_price(token, ticker, start_date, end_date)
-                rows = response.get("output2") or response.get("output") or []
-                df = pd.DataFrame(rows) if rows else pd.DataFrame()
-                if not df.empty:
-                    if "stck_clpr" in df.columns:
-                        df = df.rename(columns={"stck_clpr": COL_CLOSE, "stck_hgpr": COL_HIGH, "stck_lwpr": COL_LOW, "stck_oprc": COL_OPEN, "stck_bsop_date": COL_DATE})
-                    elif "clos" in df.columns:
-                        df = df.rename(columns={"clos": COL_CLOSE, "high": COL_HIGH, "low": COL_LOW, "open": COL_OPEN, "xymd": COL_DATE})
-                    else:
-                        df = df.rename(columns={"last": COL_CLOSE, "high": COL_HIGH, "low": COL_LOW, "open": COL_OPEN, "xymd": COL_DATE})
-                if df.empty or COL_CLOSE not in df.columns:
-                    df = cls._fallback_index_history_fdr(ticker, days)
+                if paginate and len(columns["date"]) >= KIS_HISTORY_BATCH_LIMIT:
+                    try:
+                        new_end_date = cls._before_earliest(columns["date"].min())
+                        logger.info(f"➕ Fetching additional 100 rows for {ticker} (End Date: {new_end_date})")
+                        columns2 = KisFetcher.fetch_daily_price_arrays(token, ticker, start_date, new_end_date)
+                        if columns2:
+                            columns = {key: np.concatenate((values, columns2[key])) for key, values in columns.items()}
+                    except Exception as ex:
+                        logger.warning(f"⚠️ Failed to fetch additional rows for {ticker}: {ex}")
+                df = cls._kr_history_frame(columns)
             else:
                 response = KisFetcher.fetch_overseas_daily_price(token, ticker, start_date, end_date)
-                if not response.get("output"):
-                    return pd.DataFrame()
-                df = pd.DataFrame(response["output"])
-                if "clos" in df.columns:
-                    df = df.rename(columns={"clos": COL_CLOSE, "high": COL_HIGH, "low": COL_LOW, "open": COL_OPEN, "xymd": COL_DATE})
+                if route == "IDX":
+                    rows = response.get("output2") or response.get("output") or []
                 else:
-                    df = df.rename(columns={"last": COL_CLOSE, "high": COL_HIGH, "low": COL_LOW, "open": COL_OPEN, "xymd": COL_DATE})
+                    rows = response.get("output") or []
+                    if not rows:
+                        return pd.DataFrame()
+                if paginate and len(rows) >= KIS_HISTORY_BATCH_LIMIT:
+                    rows = rows + cls._fetch_overseas_page(token, ticker, start_date, rows)
+                df = cls._overseas_history_frame(rows)
+                # 지수는 KIS 응답이 비면 FDR로 보완 (FDR은 요청 기간 전체를 한 번에 반환하므로 추가 페이지 불필요)
+                if route == "IDX" and (df.empty or COL_CLOSE not in df.columns):
+                    df = cls._fallback_index_history_fdr(ticker, days)
 
             if COL_CLOSE not in df.columns:
                 logger.error(f"❌ 'Close' column missing for {ticker}. Columns: {df.columns.tolist()}")
                 return pd.DataFrame()
 
-            if len(df) >= KIS_HISTORY_BATCH_LIMIT and days > 150:
+            df[COL_DATE] = cls._parse_dates(df[COL_DATE])
+            df.set_index(COL_DATE, inplace=True)
+            # 국내 배열 경로는 이미 float64이므로 문자열(object) 컬럼만 변환
+            price_cols = [col for col in PRICE_COLUMNS if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])]
+            if price_cols:
                 try:
-                    # 가장 오래된 날짜를 기준으로 이전 100건 추가 요청
-                    df[COL_DATE] = pd.to_datetime(df[COL_DATE])
-                    earliest_date = df[COL_DATE].min()
-                    new_end_date = (earliest_date - timedelta(days=1)).strftime("%Y%m%d")
-                    
-                    logger.info(f"➕ Fetching additional 100 rows for {ticker} (End Date: {new_end_date})")
-                    if is_kr(ticker):
-                        response2 = KisFetcher.fetch_daily_price(token, ticker, start_date, new_end_date)
-                        if response2 and response2.get("output2"):
-                            df2 = pd.DataFrame(response2["output2"])
-                            df2 = df2.rename(columns={"stck_clpr": COL_CLOSE, "stck_hgpr": COL_HIGH, "stck_lwpr": COL_LOW, "stck_oprc": COL_OPEN, "stck_bsop_date": COL_DATE})
-                            df = pd.concat([df, df2], ignore_index=True)
-                    else:
-                        response2 = KisFetcher.fetch_overseas_daily_price(token, ticker, start_date, new_end_date)
-                        output2 = response2.get("output") or response2.get("output2")
-                        if output2:
-                            df2 = pd.DataFrame(output2)
-                            if "clos" in df2.columns:
-                                df2 = df2.rename(columns={"clos": COL_CLOSE, "high": COL_HIGH, "low": COL_LOW, "open": COL_OPEN, "xymd": COL_DATE})
-                            else:
-                                df2 = df2.rename(columns={"last": COL_CLOSE, "high": COL_HIGH, "low": COL_LOW, "open": COL_OPEN, "xymd": COL_DATE})
-                            df = pd.concat([df, df2], ignore_index=True)
-                except Exception as ex:
-                    logger.warning(f"⚠️ Failed to fetch additional rows for {ticker}: {ex}")
+                    # KIS 응답은 대부분 숫자 문자열이므로 일괄 astype을 먼저 시도
+                    df[price_cols] = df[price_cols].astype(np.float64)
+                except (TypeError, ValueError):
+                    # 빈 문자열 등 변환 불가 값이 섞인 경우만 컬럼별 coerce
+                    df[price_cols] = df[price_cols].apply(pd.to_numeric, errors='coerce')
 
-            df[COL_DATE] = pd.to_datetime(df[COL_DATE])
-            df.set_index(COL_DATE, inplace=True)
-            for col in [COL_CLOSE, COL_HIGH, COL_LOW, COL_OPEN]:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-            
+            # KIS 일봉은 최신순(내림차순)으로 내려오므로 뒤집기만 하고, 순서가 섞인 경우에만 정렬
+            if df.index.is_monotonic_increasing:
+                return df
+            if df.index.is_monotonic_decreasing:
+                return df.iloc[::-1]
             return df.sort_index()
         except Exception as e:
             logger.error(f"Error fetching history for {ticker} via KIS: {e}")
             return pd.DataFrame()
 
+    @classmethod
+    def _fetch_overseas_page(cls, token: str, ticker: str, start_date: str, rows: list) -> list:
+        """가장 오래된 일자 이전 100건을 추가 조회해 원본 행 목록으로 반환 (실패 시 빈 목록)"""
+        try:
+            # YYYYMMDD 문자열은 사전순 최솟값이 곧 가장 오래된 일자
+            earliest = min(d for d in (row.get("xymd") or row.get("stck_bsop_date") for row in rows) if d)
+            new_end_date = cls._before_earliest(earliest)
+            logger.info(f"➕ Fetching additional 100 rows for {ticker} (End Date: {new_end_date})")
+            response = KisFetcher.fetch_overseas_daily_price(token, ticker, start_date, new_end_date)
+            return response.get("output") or response.get("output2") or []
+        except Exception as ex:
+            logger.warning(f"⚠️ Failed to fetch additional rows for {ticker}: {ex}")
+            return []
+
+    @staticmethod
+    def _before_earliest(earliest) -> str:
+        """추가 페이지 조회용 종료일 (가장 오래된 일자의 전날, YYYYMMDD). datetime64/Timestamp/YYYYMMDD 문자열 허용"""
+        return (pd.Timestamp(earliest) - timedelta(days=1)).strftime(KIS_DATE_FORMAT)
+
+    @staticmethod
+    def _overseas_history_frame(rows: list) -> pd.DataFrame:
+        """해외/지수 일봉 응답 행 목록을 히스토리 DataFrame으로 변환.
+        응답 필드 형태(stck_clpr/clos/last)를 첫 행으로 판별하고 필요한 컬럼만 골라 생성합니다.
+        종가 필드가 없으면 빈 DataFrame
+        """
+        # 휴장일 등으로 비어 있는 행({})은 제외
+        rows = [row for row in rows if row]
+        if not rows:
+            return pd.DataFrame()
+        sample = rows[0]
+        rename_map = next((m for key, m in _HISTORY_RENAME_BY_CLOSE_KEY if key in sample), None)
+        if rename_map is None:
+            logger.debug(f"Unknown daily price fields: {list(sample)}")
+            return pd.DataFrame()
+        return pd.DataFrame({dst: [row.get(src) for row in rows] for src, dst in rename_map.items()})
+
+    @staticmethod
+    def _parse_dates(values: pd.Series) -> pd.Series:
+        """KIS 날짜 컬럼(YYYYMMDD 문자열)을 datetime으로 변환. 이미 datetime이면 그대로 반환"""
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+        try:
+            return pd.to_datetime(values, format=KIS_DATE_FORMAT, cache=True)
+        except (TypeError, ValueError):
+            # 형식이 섞인 경우(FDR 보완 데이터 등)만 추론 경로 사용
+            return pd.to_datetime(values)
+
+    @staticmethod
+    def _kr_history_frame(columns: dict) -> pd.DataFrame:
+        """KisFetcher.fetch_daily_price_arrays 결과(컬럼별 배열)를 히스토리 DataFrame으로 변환"""
+        if not columns:
+            return pd.DataFrame()
+        return pd.DataFrame({
+            COL_DATE: columns["date"],
+            COL_OPEN: columns["open"],
+            COL_HIGH: columns["high"],
+            COL_LOW: columns["low"],
+            COL_CLOSE: columns["close"],
+            COL_VOLUME: columns["volume"],
+        })
+
     @classmethod
     def _fallback_index_history_fdr(cls, ticker: str, days: int = 300) -> pd.DataFrame:
         """KIS 지수 데이터 실패 시 FinanceDataReader로 보완"""
@@ -354,7 +451,6 @@ class DataService:
         symbol = FDR_INDEX_SYMBOL_MAP.get(ticker, ticker)
         
         try:
-            from datetime import timedelta
             start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
             df = fdr.DataReader(symbol, start_date)
             if df is None or df.empty:
@@ -367,6 +463,34 @@ class DataService:
             logger.warning(f"⚠️ FDR index fetch failed for {ticker}: {e}")
             return pd.DataFrame()
 
+    @classmethod
+    def _collect_daily_metrics(cls, ticker: str, market: str) -> Optional[dict]:
+        """일일 동기화용 종목 지표 수집 (현재가/지표/DCF). 현재가 조회 실패 시 None"""
+        token = KisService.get_access_token()
+        if market == "KR":
+            price_info = KisFetcher.fetch_domestic_price(token, ticker)
+        else:
+            price_info = KisFetcher.fetch_overseas_price(token, ticker)
+        if not price_info:
+            return None
+
+        hist = cls.get_price_history(ticker, days=HISTORY_DAYS_DEFAULT)
+        indicators = {}
+        if not hist.empty:
+            indicators = IndicatorService.get_latest_indicators(hist[COL_CLOSE])
+        dcf_val = DcfService.calculate_dcf(ticker)
+        return {
+            "current_price": price_info.get("price"),
+            "market_cap": price_info.get("market_cap"),
+            "per": price_info.get("per"),
+            "pbr": price_info.get("pbr"),
+            "eps": price_info.get("eps"),
+            "bps": price_info.get("bps"),
+            "rsi": indicators.get("rsi"),
+            "ema": indicators.get("ema"),
+            "dcf_value": dcf_val,
+        }
+
     @classmethod
     def sync_daily_market_data(cls, limit: int = 100):
         """매일 1회 실행: 상위 종목 수집 -> 지표 계산 -> DB 저장"""
@@ -377,45 +501,20 @@ class DataService:
         us_tickers = cls.get_top_us_tickers(limit=limit)
         
         all_tickers = [(t, "KR") for t in kr_tickers] + [(t, "US") for t in us_tickers]
-        
-        for ticker, market in all_tickers:
-            try:
-                # 시장 시간 체크
-                if not MarketHourService.should_fetch(market):
-                    # logger.debug(f"😴 {market} market is closed. skipping {ticker}.")
-                    continue
-
-                logger.info(f"🔄 Processing {ticker} ({market})...")
-                
-                token = KisService.get_access_token()
-                if market == "KR":
-                    price_info = KisFetcher.fetch_domestic_price(token, ticker)
-                else:
-                    price_info = KisFetcher.fetch_overseas_price(token, ticker)
-                if not price_info:
-                    continue
-
-                hist = cls.get_price_history(ticker, days=HISTORY_DAYS_DEFAULT)
-                indicators = {}
-                if not hist.empty:
-                    indicators = IndicatorService.get_latest_indicators(hist[COL_CLOSE])
-                dcf_val = DcfService.calculate_dcf(ticker)
-                metrics = {
-                    "current_price": price_info.get("price"),
-                    "market_cap": price_info.get("market_cap"),
-                    "per": price_info.get("per"),
-                    "pbr": price_info.get("pbr"),
-                    "eps": price_info.get("eps"),
-                    "bps": price_info.get("bps"),
-                    "rsi": indicators.get("rsi"),
-                    "ema": indicators.get("ema"),
-                    "dcf_value": dcf_val,
-                }
-                StockMetaService.save_financials(ticker, metrics)
-                time.sleep(KIS_RATE_LIMIT_SLEEP_SEC)
-                
-            except Exception as e:
-                logger.error(f"Error syncing {ticker}: {e}")
-                continue
-        
+        # 시장 시간 체크
+        targets = [(t, m) for t, m in all_tickers if MarketHourService.should_fetch(m)]
+
+        # 조회/지표 계산은 병렬로, DB 저장은 현재 스레드에서 순차 처리 (SQLite 동시 쓰기 방지)
+        with ThreadPoolExecutor(max_workers=SYNC_DAILY_WORKERS, thread_name_prefix="daily-sync") as executor:
+            futures = {executor.submit(cls._collect_daily_metrics, t, m): t for t, m in targets}
+            for done, future in enumerate(as_completed(futures), 1):
+                ticker = futures[future]
+                try:
+                    metrics = future.result()
+                    if metrics:
+                        StockMetaService.save_financials(ticker, metrics)
+                    logger.info(f"🔄 Processed {ticker} ({done}/{len(futures)})")
+                except Exception as e:
+                    logger.error(f"Error syncing {ticker}: {e}")
+
         logger.info("✅ Daily market data sync completed.")
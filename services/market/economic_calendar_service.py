@@ -8,6 +8,7 @@ import requests
 from datetime import datetime, timezone, timedelta, date
 from zoneinfo import ZoneInfo
 from config import Config
+from utils import fast_json
 from utils.logger import get_logger
 
 logger = get_logger("economic_calendar")
@@ -85,7 +86,7 @@ class EconomicCalendarService:
                 timeout=8,
             )
             res.raise_for_status()
-            all_dates = [r["date"] for r in (res.json() or {}).get("release_dates", [])]
+            all_dates = [r["date"] for r in (fast_json.loads(res.content) or {}).get("release_dates", [])]
             # 연속된 날짜(비즈니스 데이 패턴)는 FRED 내부 업데이트이므로 월 기준 첫 날짜만 유지
             seen_months: set[str] = set()
             deduped: list[str] = []
@@ -168,7 +169,7 @@ class EconomicCalendarService:
                 timeout=6,
             )
             res.raise_for_status()
-            obs = (res.json() or {}).get("observations", [])
+            obs = (fast_json.loads(res.content) or {}).get("observations", [])
             if obs:
                 val = obs[0].get("value", ".")
                 if val not in (".", ""):
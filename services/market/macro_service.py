@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from config import Config
 from services.kis.kis_service import KisService
 from services.kis.fetch.kis_fetcher import KisFetcher
+from utils import fast_json
 from utils.logger import get_logger
 
 logger = get_logger("macro_service")
@@ -571,7 +572,7 @@ class MacroService:
             url = "https://production.dataviz.cnn.io/index/fearandgreed/graphdata"
             res = requests.get(url, timeout=8, headers=cls._CNN_HEADERS)
             res.raise_for_status()
-            data = res.json() or {}
+            data = fast_json.loads(res.content) or {}
             block = data.get("fear_and_greed", {})
             val = block.get("score")
             if val is None and isinstance(block, dict):
@@ -957,7 +958,7 @@ class MacroService:
             }
             res = requests.get(cls._fred_base_url, params=params, timeout=8)
             res.raise_for_status()
-            observations = (res.json() or {}).get("observations", [])
+            observations = (fast_json.loads(res.content) or {}).get("observations", [])
             values = []
             for obs in observations:
                 raw = str(obs.get("value", ".")).strip()
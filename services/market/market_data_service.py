@@ -292,6 +292,12 @@ class MarketDataService:
         state.volume        = int(data.get("volume",  state.volume))
         state.recalculate_indicators()
 
+    @classmethod
+    def on_realtime_data_batch(cls, ticks: Dict[str, dict]):
+        """종목별 최신 실시간 데이터 일괄 반영 ({ticker: data})."""
+        for ticker, data in ticks.items():
+            cls.on_realtime_data(ticker, data)
+
     @classmethod
     def update_price_from_sync(cls, ticker: str, price: float, change_rate: float = None):
         """포트폴리오 동기화·REST 폴링 시 현재가만 갱신 (EMA 재계산 없음)."""
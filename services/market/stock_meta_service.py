@@ -14,6 +14,8 @@ class StockMetaService:
     주식 메타 정보 및 재무 데이터 DB 연동 서비스.
     DB 연결은 repositories.database 싱글톤에 위임합니다.
     """
+    # {(api_name, is_vts): (tr_id, path)} — api_tr_meta 변경(upsert_api_tr_meta) 시 비움
+    _api_info_cache: dict = {}
 
     @classmethod
     def init_db(cls):
@@ -74,6 +76,31 @@ class StockMetaService:
         finally:
             session.close()
 
+    @classmethod
+    def bulk_upsert_stock_meta(cls, rows: list) -> int:
+        """종목 메타 일괄 저장/갱신 (rows: [{"ticker": ..., 필드: 값}], 한 번의 조회와 커밋으로 처리). 반영 건수 반환"""
+        by_ticker = {row["ticker"]: row for row in rows if row.get("ticker")}
+        if not by_ticker:
+            return 0
+        try:
+            with cls.session_scope() as session:
+                existing = {
+                    stock.ticker: stock
+                    for stock in session.query(StockMeta).filter(StockMeta.ticker.in_(list(by_ticker))).all()
+                }
+                for ticker, row in by_ticker.items():
+                    stock = existing.get(ticker)
+                    if stock is None:
+                        stock = StockMeta(ticker=ticker)
+                        session.add(stock)
+                    for key, value in row.items():
+                        if key != "ticker" and hasattr(stock, key) and value is not None:
+                            setattr(stock, key, value)
+            return len(by_ticker)
+        except Exception as e:
+            logger.error(f"Error bulk upserting stock meta ({len(by_ticker)} rows): {e}")
+            return 0
+
     @classmethod
     def get_stock_meta(cls, ticker: str):
         """종목 메타 정보 조회"""
@@ -332,6 +359,7 @@ class StockMetaService:
                     setattr(meta, key, value)
             
             session.commit()
+            cls.clear_api_info_cache()
             if meta:
                 session.expunge(meta)
             return meta
@@ -439,13 +467,22 @@ class StockMetaService:
         finally:
             session.close()
 
+    @classmethod
+    def clear_api_info_cache(cls) -> None:
+        """TR ID/경로 조회 캐시 비우기 (api_tr_meta 변경 반영용)"""
+        cls._api_info_cache.clear()
+
     @classmethod
     def get_api_info(cls, api_name: str, is_vts: bool = None):
-        """환경에 맞는 TR ID와 경로 조회"""
+        """환경에 맞는 TR ID와 경로 조회 (조회 결과는 프로세스 내 캐시)"""
         if is_vts is None:
             from config import Config
             is_vts = Config.KIS_IS_VTS
-            
+
+        key = (api_name, bool(is_vts))
+        cached = cls._api_info_cache.get(key)
+        if cached is not None:
+            return cached
         meta = cls.get_api_meta(api_name)
         # DB 복구 직후 api_tr_meta가 비어있을 수 있어 1회 자동 초기화
         if not meta:
@@ -459,6 +496,7 @@ class StockMetaService:
             
         tr_id = meta.tr_id_vts if is_vts else meta.tr_id_real
         path = (meta.api_path_vts if is_vts and meta.api_path_vts else meta.api_path)
+        cls._api_info_cache[key] = (tr_id, path)
         return tr_id, path
 
     @classmethod
@@ -95,10 +95,9 @@ class PortfolioService:
     def sync_with_kis(cls, user_id: str = "sean") -> List[HoldingSchema]:
         """KIS 실제 잔고와 동기화 (DB 업데이트 포함)"""
         logger.info(f"🔄 Syncing portfolio with KIS for user: {user_id}")
-        balance_data = KisService.get_balance()
+        balance_data, overseas_balance = KisService.get_all_balances()
         if not balance_data:
             return cls.load_portfolio(user_id) # 실패 시 로컬(DB) 데이터 반환
-        overseas_balance = KisService.get_overseas_balance()
 
         existing_holdings = cls.load_portfolio(user_id)  # List[dict]
         existing_us_map = {
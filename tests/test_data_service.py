@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from services.market.data_service import DataService
+
+
+class TestDataServiceFundFilter(unittest.TestCase):
+    def test_kr_fund_keywords_match_case_insensitively(self):
+        self.assertTrue(DataService._is_fund_like_security("069500", "KODEX 200", "KR"))
+        self.assertTrue(DataService._is_fund_like_security("252670", "kodex 200선물인버스2X", "KR"))
+        self.assertFalse(DataService._is_fund_like_security("005930", "삼성전자", "KR"))
+
+    def test_us_fund_detected_by_name_or_ticker(self):
+        self.assertTrue(DataService._is_fund_like_security("TQQQ", "ProShares UltraPro QQQ ETF", "US"))
+        self.assertTrue(DataService._is_fund_like_security("SPY", "", "US"))
+        self.assertFalse(DataService._is_fund_like_security("AAPL", "Apple Inc", "US"))
+
+
+class TestDataServiceOverseasFrame(unittest.TestCase):
+    def test_frame_keeps_only_mapped_columns_and_skips_blank_rows(self):
+        rows = [
+            {"xymd": "20240105", "clos": "187.5", "high": "188", "low": "185", "open": "186", "tvol": "1000"},
+            {},
+        ]
+        df = DataService._overseas_history_frame(rows)
+        self.assertEqual(list(df.columns), ["Close", "High", "Low", "Open", "Date"])
+        self.assertEqual(len(df), 1)
+        self.assertEqual(df["Close"].iloc[0], "187.5")
+
+    def test_unknown_close_field_returns_empty_frame(self):
+        self.assertTrue(DataService._overseas_history_frame([{"xymd": "20240105", "price": "1"}]).empty)
+
+
+class TestDataServiceHistoryCache(unittest.TestCase):
+    def setUp(self):
+        DataService.clear_history_cache()
+
+    def tearDown(self):
+        DataService.clear_history_cache()
+
+    def test_repeated_history_request_reuses_cached_copy(self):
+        frame = pd.DataFrame({"Close": [100.0, 101.0]})
+        with patch.object(DataService, "_load_price_history", return_value=frame) as loader:
+            first = DataService.get_price_history("005930", days=365)
+            first["RSI"] = 50.0
+            second = DataService.get_price_history("005930", days=365)
+            DataService.get_price_history("005930", days=300)
+        self.assertEqual(loader.call_count, 2)
+        self.assertEqual(list(second.columns), ["Close"])
+
+    def test_empty_history_is_not_cached(self):
+        with patch.object(DataService, "_load_price_history", return_value=pd.DataFrame()) as loader:
+            DataService.get_price_history("AAPL", days=365)
+            DataService.get_price_history("AAPL", days=365)
+        self.assertEqual(loader.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
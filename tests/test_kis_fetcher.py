@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from services.kis.fetch.kis_fetcher import (
+    DOMESTIC_PRICE_FIELDS,
+    KisFetcher,
+    _map_numeric_fields,
+    _normalize_excd,
+    _safe_float,
+)
+
+
+class TestKisFetcherHelpers(unittest.TestCase):
+    def test_safe_float_handles_blank_and_invalid_values(self):
+        self.assertEqual(_safe_float(""), 0.0)
+        self.assertEqual(_safe_float(None), 0.0)
+        self.assertEqual(_safe_float("abc", default=-1.0), -1.0)
+        self.assertEqual(_safe_float(" 12.5 "), 12.5)
+
+    def test_safe_float_accepts_numeric_values(self):
+        self.assertEqual(_safe_float(3.5), 3.5)
+        result = _safe_float(7)
+        self.assertIsInstance(result, float)
+        self.assertEqual(result, 7.0)
+
+    def test_map_numeric_fields_converts_all_fields(self):
+        output = {"stck_prpr": "70000", "prdy_ctrt": "-1.25", "per": ""}
+        result = _map_numeric_fields(output, DOMESTIC_PRICE_FIELDS)
+        self.assertEqual(set(result), {key for key, _ in DOMESTIC_PRICE_FIELDS})
+        self.assertEqual(result["price"], 70000.0)
+        self.assertEqual(result["change_rate"], -1.25)
+        self.assertEqual(result["per"], 0.0)
+        self.assertEqual(result["volume"], 0.0)
+
+    def test_normalize_excd_maps_exchange_codes(self):
+        self.assertEqual(_normalize_excd("NASD"), "NAS")
+        self.assertEqual(_normalize_excd("nyse"), "NYS")
+        self.assertEqual(_normalize_excd("AMS"), "AMS")
+        self.assertEqual(_normalize_excd("IDX"), "IDX")
+        self.assertEqual(_normalize_excd("HKSE"), "HKS")
+
+
+class TestKisFetcherPriceCache(unittest.TestCase):
+    def setUp(self):
+        KisFetcher._price_cache.clear()
+
+    def test_cached_price_reuses_result_within_ttl(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {"price": 100.0}
+
+        first = KisFetcher._get_cached_price(("KR", "005930"), loader)
+        second = KisFetcher._get_cached_price(("KR", "005930"), loader)
+        self.assertEqual(first, {"price": 100.0})
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+
+    def test_expired_entry_is_reloaded_and_clear_cache_drops_entries(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {"output": []}
+
+        KisFetcher._get_cached_price(("RANK", "NAS"), loader, ttl=0.0)
+        KisFetcher._get_cached_price(("RANK", "NAS"), loader, ttl=60.0)
+        KisFetcher._get_cached_price(("RANK", "NAS"), loader, ttl=60.0)
+        KisFetcher.clear_cache()
+        KisFetcher._get_cached_price(("RANK", "NAS"), loader, ttl=60.0)
+        self.assertEqual(len(calls), 3)
+
+    def test_empty_result_is_not_cached(self):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return {}
+
+        KisFetcher._get_cached_price(("KR", "000660"), loader)
+        KisFetcher._get_cached_price(("KR", "000660"), loader)
+        self.assertEqual(len(calls), 2)
+
+
+class TestKisFetcherDailyArrays(unittest.TestCase):
+    def test_daily_price_arrays_skip_blank_rows_and_coerce_numbers(self):
+        response = {"output2": [
+            {"stck_bsop_date": "20240105", "stck_oprc": "100", "stck_hgpr": "110",
+             "stck_lwpr": "90", "stck_clpr": "105", "acml_vol": "1000"},
+            {"stck_bsop_date": "20240104", "stck_oprc": "", "stck_hgpr": "108",
+             "stck_lwpr": "95", "stck_clpr": "99", "acml_vol": "800"},
+            {},
+        ]}
+        with patch.object(KisFetcher, "fetch_daily_price", return_value=response):
+            cols = KisFetcher.fetch_daily_price_arrays("token", "005930", "20240101", "20240105")
+        self.assertEqual(cols["date"].dtype, np.dtype("datetime64[D]"))
+        self.assertEqual(str(cols["date"][0]), "2024-01-05")
+        self.assertEqual(cols["close"].tolist(), [105.0, 99.0])
+        self.assertTrue(np.isnan(cols["open"][1]))
+
+    def test_daily_price_arrays_empty_response(self):
+        with patch.object(KisFetcher, "fetch_daily_price", return_value={}):
+            self.assertEqual(KisFetcher.fetch_daily_price_arrays("token", "005930", "20240101", "20240105"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
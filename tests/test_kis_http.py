@@ -0,0 +1,133 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from config import Config
+from services.kis.kis_http import RETRY_JITTER, CircuitBreaker, KisHttp, retry_delay
+from utils import fast_json
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes = b"", headers: dict = None):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode("utf-8")
+        self.headers = headers or {}
+
+
+class TestKisHttpRateLimit(unittest.TestCase):
+    def test_server_error_is_retryable_for_queries(self):
+        self.assertTrue(KisHttp.is_rate_limited(_FakeResponse(500)))
+        self.assertTrue(KisHttp.is_rate_limited(_FakeResponse(429)))
+
+    def test_server_error_without_limit_code_is_not_retried_for_orders(self):
+        response = _FakeResponse(500, b'{"rt_cd": "1", "msg_cd": "APBK0013", "msg1": "error"}')
+        self.assertFalse(KisHttp.is_rate_limited(response, idempotent=False))
+
+    def test_limit_code_is_detected_for_orders(self):
+        response = _FakeResponse(500, b'{"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "limit"}')
+        self.assertTrue(KisHttp.is_rate_limited(response, idempotent=False))
+
+    def test_limit_message_is_detected_without_code(self):
+        response = _FakeResponse(200, '{"rt_cd": "1", "msg1": "초당 거래건수를 초과하였습니다."}'.encode("utf-8"))
+        self.assertTrue(KisHttp.is_rate_limited(response, idempotent=False))
+
+    def test_success_response_is_not_rate_limited(self):
+        response = _FakeResponse(200, b'{"rt_cd": "0", "output": {}}')
+        self.assertFalse(KisHttp.is_rate_limited(response))
+
+
+class TestKisHttpThrottle(unittest.TestCase):
+    def setUp(self):
+        self._saved = (KisHttp._bucket_capacity, KisHttp._refill_rate, KisHttp._tokens, KisHttp._bucket_ts)
+
+    def tearDown(self):
+        KisHttp._bucket_capacity, KisHttp._refill_rate, KisHttp._tokens, KisHttp._bucket_ts = self._saved
+
+    @unittest.skipUnless(Config.KIS_IS_VTS, "모의투자 기본값 검증")
+    def test_vts_defaults_never_exceed_two_requests_per_second(self):
+        KisHttp._bucket_capacity = KisHttp._tokens = Config.KIS_RATE_BURST
+        KisHttp._refill_rate = Config.KIS_RATE_PER_SEC
+        KisHttp._bucket_ts = 0.0
+        slots = []
+        # 10개 요청이 같은 시각에 동시에 도착한 경우: 각 요청의 송신 시각 = 도착 시각 + 대기
+        with patch("services.kis.kis_http.time.monotonic", return_value=100.0), \
+                patch("services.kis.kis_http.time.sleep", side_effect=lambda sec: slots.append(100.0 + sec)) as sleep:
+            for _ in range(10):
+                sleep.reset_mock()
+                KisHttp.throttle()
+                if not sleep.called:
+                    slots.append(100.0)
+        slots.sort()
+        self.assertEqual(len(slots), 10)
+        for first, third in zip(slots, slots[2:]):
+            self.assertGreaterEqual(third - first, 1.0)
+
+
+class TestKisHttpHeaders(unittest.TestCase):
+    def test_headers_are_reused_per_token_and_tr_id(self):
+        first = KisHttp.build_headers("token-a", "FHKST01010100")
+        self.assertIs(first, KisHttp.build_headers("token-a", "FHKST01010100"))
+        self.assertEqual(first["authorization"], "Bearer token-a")
+        self.assertEqual(first["tr_id"], "FHKST01010100")
+
+    def test_new_token_rebuilds_headers(self):
+        old = KisHttp.build_headers("token-a", "FHKST01010100")
+        new = KisHttp.build_headers("token-b", "FHKST01010100")
+        self.assertIsNot(old, new)
+        self.assertEqual(new["authorization"], "Bearer token-b")
+
+
+class TestKisHttpRetryDelay(unittest.TestCase):
+    def test_retry_after_seconds_header_is_honored(self):
+        response = _FakeResponse(429, headers={"Retry-After": "3"})
+        self.assertEqual(retry_delay(0, response), 3.0)
+
+    def test_retry_after_is_capped(self):
+        response = _FakeResponse(429, headers={"Retry-After": "120"})
+        self.assertEqual(retry_delay(0, response, cap=30.0), 30.0)
+
+    def test_exponential_backoff_with_jitter_bounds(self):
+        for attempt in range(4):
+            delay = retry_delay(attempt, _FakeResponse(500), base=1.0, cap=30.0)
+            low = min(30.0, 2 ** attempt)
+            self.assertGreaterEqual(delay, low)
+            self.assertLessEqual(delay, low * (1 + RETRY_JITTER))
+
+
+class TestKisHttpPost(unittest.TestCase):
+    def setUp(self):
+        KisHttp._prepared_state = ("", {})
+
+    def tearDown(self):
+        KisHttp._prepared_state = ("", {})
+
+    def test_order_post_honors_ca_bundle_env(self):
+        headers = {"authorization": "Bearer t", "tr_id": "VTTC0802U"}
+        with patch.dict(os.environ, {"REQUESTS_CA_BUNDLE": "/tmp/custom-ca.pem"}), \
+                patch.object(KisHttp, "throttle"), \
+                patch.object(KisHttp._session, "send", return_value=_FakeResponse(200, b'{"rt_cd": "0"}')) as send:
+            KisHttp.post_with_retry("https://example.com/uapi/order", headers, {"PDNO": "005930"})
+        self.assertEqual(send.call_args.kwargs["verify"], "/tmp/custom-ca.pem")
+        self.assertEqual(fast_json.loads(send.call_args.args[0].body), {"PDNO": "005930"})
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold_and_half_opens_after_timeout(self):
+        breaker = CircuitBreaker("test", threshold=2, open_sec=30.0)
+        with patch("services.kis.kis_http.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+            self.assertTrue(breaker.allow())
+            breaker.record_failure()
+            self.assertFalse(breaker.allow())
+        with patch("services.kis.kis_http.time.monotonic", return_value=131.0):
+            # 차단 시간 경과 → 시험 호출 1회만 허용
+            self.assertTrue(breaker.allow())
+            self.assertFalse(breaker.allow())
+            breaker.record_success()
+            self.assertTrue(breaker.allow())
+            self.assertTrue(breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
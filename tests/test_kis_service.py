@@ -0,0 +1,179 @@
+import asyncio
+import contextlib
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from config import Config
+from services.kis.kis_service import ORDER_BATCH_WORKERS, TOKEN_TTL_SEC, KisService, _order_pool, _token_ttl_sec
+
+
+class TestKisServiceAccountParts(unittest.TestCase):
+    def setUp(self):
+        KisService.reset_account_cache()
+
+    def tearDown(self):
+        KisService.reset_account_cache()
+
+    def test_account_formats_and_cache_follows_config(self):
+        with patch.object(Config, "KIS_ACCOUNT_NO", "50162391-01"):
+            self.assertEqual(KisService._get_account_parts(), ("50162391", "01"))
+            self.assertEqual(KisService._get_account_parts(), ("50162391", "01"))
+        with patch.object(Config, "KIS_ACCOUNT_NO", "12345678"):
+            self.assertEqual(KisService._get_account_parts(), ("12345678", "01"))
+        with patch.object(Config, "KIS_ACCOUNT_NO", "123"):
+            self.assertEqual(KisService._get_account_parts(), ("", "01"))
+
+
+class TestKisServiceToken(unittest.TestCase):
+    def setUp(self):
+        self._saved_state = KisService._token_state
+
+    def tearDown(self):
+        KisService._token_state = self._saved_state
+
+    def test_valid_memory_token_skips_file_and_issue(self):
+        KisService._token_state = ("cached-token", time.monotonic() + 60)
+        with patch.object(KisService, "_load_token_file") as load, \
+                patch.object(KisService, "_issue_access_token") as issue:
+            self.assertEqual(KisService.get_access_token(), "cached-token")
+        load.assert_not_called()
+        issue.assert_not_called()
+
+    def test_expired_memory_token_is_reissued(self):
+        KisService._token_state = ("old-token", time.monotonic() - 1)
+        with patch("services.kis.kis_service._token_file_lock", contextlib.nullcontext), \
+                patch.object(KisService, "_load_token_file", return_value=False), \
+                patch.object(KisService, "_issue_access_token", return_value="new-token") as issue:
+            self.assertEqual(KisService.get_access_token(), "new-token")
+        issue.assert_called_once_with()
+
+    def test_token_ttl_uses_expires_in_with_fallback(self):
+        self.assertEqual(_token_ttl_sec({"expires_in": 86400}), 86400)
+        self.assertEqual(_token_ttl_sec({"expires_in": "86400"}), 86400)
+        self.assertEqual(_token_ttl_sec({}), TOKEN_TTL_SEC)
+        self.assertEqual(_token_ttl_sec({"expires_in": "bad"}), TOKEN_TTL_SEC)
+        self.assertEqual(_token_ttl_sec({"expires_in": 0}), TOKEN_TTL_SEC)
+
+
+class TestKisServiceTemplates(unittest.TestCase):
+    def setUp(self):
+        KisService.reset_account_cache()
+        KisService.reset_templates()
+
+    def tearDown(self):
+        KisService.reset_account_cache()
+        KisService.reset_templates()
+
+    def test_templates_follow_account_and_stay_unmodified(self):
+        with patch.object(Config, "KIS_ACCOUNT_NO", "50162391-01"):
+            templates = KisService._get_templates()
+            self.assertIs(KisService._get_templates(), templates)
+            self.assertEqual(templates["overseas_order"]["CANO"], "50162391")
+            self.assertEqual(templates["balance"]["INQR_DVSN"], "02")
+            body = {**templates["domestic_order"], "PDNO": "005930"}
+            self.assertNotIn("PDNO", templates["domestic_order"])
+            self.assertEqual(body["ACNT_PRDT_CD"], "01")
+        with patch.object(Config, "KIS_ACCOUNT_NO", "12345678-22"):
+            self.assertEqual(KisService._get_templates()["overseas_balance"]["ACNT_PRDT_CD"], "22")
+        with patch.object(Config, "KIS_ACCOUNT_NO", "123"):
+            self.assertIsNone(KisService._get_templates())
+
+
+class TestKisServiceBatchOrders(unittest.TestCase):
+    def test_send_orders_routes_by_market_and_keeps_order(self):
+        with patch.object(KisService, "send_order", return_value={"status": "success", "market": "KR"}) as kr, \
+                patch.object(KisService, "send_overseas_order", return_value={"status": "success", "market": "US"}) as us:
+            results = KisService.send_orders([
+                ("AAPL", 1, 190.0, "buy", "NASD"),
+                ("005930", 2, 0, "sell"),
+            ])
+        self.assertEqual([r["market"] for r in results], ["US", "KR"])
+        kr.assert_called_once_with("005930", 2, 0, "sell")
+        us.assert_called_once_with("AAPL", 1, 190.0, "buy", market="NASD")
+
+    def test_send_orders_reports_exceptions_per_order(self):
+        with patch.object(KisService, "send_order", side_effect=RuntimeError("boom")):
+            results = KisService.send_orders([("005930", 1, 0, "buy")])
+        self.assertEqual(results, [{"status": "error", "msg": "boom"}])
+
+    def test_send_orders_cancels_queued_orders_on_timeout(self):
+        release = threading.Event()
+        sent = []
+
+        def slow_order(ticker, *args):
+            sent.append(ticker)
+            release.wait(5)
+            return {"status": "success"}
+
+        orders = [(f"00593{i}", 1, 0, "buy") for i in range(ORDER_BATCH_WORKERS + 2)]
+        with patch.object(KisService, "send_order", side_effect=slow_order):
+            try:
+                results = KisService.send_orders(orders, max_wait_sec=0.2)
+            finally:
+                release.set()
+            # 풀 대기열은 FIFO이므로 이후 작업이 실행되면 취소된 주문은 이미 건너뛴 상태
+            _order_pool.submit(lambda: None).result(timeout=5)
+        statuses = [r["status"] for r in results]
+        self.assertEqual(statuses.count("timeout"), ORDER_BATCH_WORKERS)
+        self.assertEqual(statuses[ORDER_BATCH_WORKERS:], ["cancelled", "cancelled"])
+        self.assertEqual(len(sent), ORDER_BATCH_WORKERS)
+
+    def test_async_single_order_does_not_wait_behind_batch(self):
+        release = threading.Event()
+
+        def slow_batch_order(*args):
+            release.wait(5)
+            return {"status": "success"}
+
+        busy = [_order_pool.submit(slow_batch_order) for _ in range(ORDER_BATCH_WORKERS + 2)]
+        try:
+            with patch.object(KisService, "send_order", return_value={"status": "success"}):
+                result = asyncio.run(asyncio.wait_for(KisService.send_order_async("005930", 1), timeout=2))
+            self.assertEqual(result, {"status": "success"})
+        finally:
+            release.set()
+            for future in busy:
+                future.result(timeout=5)
+
+
+class _JsonResponse:
+    def __init__(self, body: bytes):
+        self.status_code = 200
+        self.content = body
+        self.text = body.decode("utf-8")
+
+
+class TestKisServiceBalance(unittest.TestCase):
+    def setUp(self):
+        KisService._balance_breaker.record_success()
+
+    def test_business_error_is_retried_before_success(self):
+        responses = [
+            _JsonResponse(b'{"rt_cd": "1", "msg1": "temporary"}'),
+            _JsonResponse(b'{"rt_cd": "0", "output1": [{"pdno": "005930"}], "output2": []}'),
+        ]
+        with patch.object(KisService, "_get_templates", return_value={"balance": {}}), \
+                patch.object(KisService, "_get_tr_id", return_value="VTTC8434R"), \
+                patch.object(KisService, "get_headers", return_value={}), \
+                patch("services.kis.kis_service.KisHttp.get_with_retry", side_effect=responses) as get, \
+                patch("services.kis.kis_service.time.sleep") as sleep:
+            result = KisService.get_balance()
+        self.assertEqual(result["holdings"], [{"pdno": "005930"}])
+        self.assertEqual(get.call_count, 2)
+        sleep.assert_called_once()
+
+
+class TestKisServiceOrderValidation(unittest.TestCase):
+    def test_invalid_overseas_order_returns_before_any_lookup(self):
+        with patch.object(KisService, "get_headers") as headers, \
+                patch.object(KisService, "_get_account_parts") as account:
+            for args in (("AAPL", 1, 0), ("AAPL", 0, 10.0), ("AA PL", 1, 10.0)):
+                self.assertEqual(KisService.send_overseas_order(*args)["status"], "error")
+        headers.assert_not_called()
+        account.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+"""JSON 직렬화/역직렬화 헬퍼.
+
+KIS 응답 파싱처럼 호출 빈도가 높은 경로에서 사용한다.
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 대체한다.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경 → 표준 json 사용
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """bytes/str JSON 문자열을 파싱."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """객체를 UTF-8 JSON bytes로 직렬화 (HTTP body, 파일 저장용)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """객체를 JSON 문자열로 직렬화 (WebSocket 텍스트 프레임 등)."""
+    return dumps_bytes(obj).decode("utf-8")
@@ -7,6 +7,9 @@ from __future__ import annotations
 
 from typing import List
 
+# 가격 이력 조회 시 지수 API 경로를 사용하는 심볼
+INDEX_TICKERS = frozenset({"SPX", "NAS", "VIX", "DJI"})
+
 
 def is_kr(ticker: str) -> bool:
     """한국 종목 여부 — 숫자로만 구성된 티커."""
@@ -23,6 +26,13 @@ def market_type(ticker: str) -> str:
     return "KR" if is_kr(ticker) else "US"
 
 
+def history_route(ticker: str) -> str:
+    """가격 이력 조회 경로: 'KR'(국내) / 'IDX'(지수) / 'US'(해외 종목)."""
+    if is_kr(ticker):
+        return "KR"
+    return "IDX" if ticker in INDEX_TICKERS else "US"
+
+
 def filter_kr(holdings: List[dict]) -> List[dict]:
     """보유 목록에서 한국 종목만 반환."""
     return [h for h in holdings if is_kr(str(h.get("ticker", "")))]